@@ -0,0 +1,64 @@
+"""Regression check: a run deadline also bounds urllib3's transport retries.
+
+Points a client with a short CancelToken deadline at a fake server slower
+than the deadline and exits non-zero when the request outlives the deadline
+by more than the slack or was sent more than once:
+
+    python benchmarks/deadline_check.py --deadline 1.0 --retries 2
+"""
+import os
+import sys
+import time
+import argparse
+
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from telegram_api_getter import CancelToken, Cancelled, TelegramAppClient  # noqa: E402
+from telegram_api_getter.transport import TransportConfig  # noqa: E402
+from fake_server import FakeTelegramConfig, FakeTelegramServer  # noqa: E402
+
+
+def run_check(args) -> dict:
+    server = FakeTelegramServer(FakeTelegramConfig(latency=args.deadline * 2)).start()
+    client = TelegramAppClient(transport=TransportConfig(retries=args.retries))
+    client.base_url = server.base_url
+    client.log = lambda text: None
+    client.use_cancel_token(CancelToken(args.deadline))
+
+    started = time.perf_counter()
+    try:
+        client.get_csrf_token()
+    except (Cancelled, requests.RequestException):
+        pass
+    finally:
+        elapsed = time.perf_counter() - started
+        client.session.close()
+        server.stop()
+    return {'elapsed_s': elapsed, 'requests': server.state.requests.get('GET /auth/login', 0)}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--deadline', type=float, default=1.0)
+    parser.add_argument('--retries', type=int, default=2)
+    parser.add_argument('--slack', type=float, default=0.5, help='seconds allowed past the deadline')
+    args = parser.parse_args(argv)
+
+    result = run_check(args)
+    print(f"deadline {args.deadline:.2f} s, retries {args.retries}: "
+          f"{result['elapsed_s']:.2f} s, {result['requests']} GET /auth/login")
+
+    failed = False
+    if result['elapsed_s'] > args.deadline + args.slack:
+        print(f"FAIL: request outlived the deadline by {result['elapsed_s'] - args.deadline:.2f} s")
+        failed = True
+    if result['requests'] > 1:
+        print("FAIL: request was retried after the deadline")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
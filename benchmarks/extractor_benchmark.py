@@ -0,0 +1,169 @@
+"""Micro-benchmark of the page parsers over the sanitized page corpus.
+
+Each page in ``corpus/v<N>/manifest.json`` lists the values a parser should
+return for it. Every parser is checked against that and timed, reporting
+nanoseconds per input byte; the exit code is non-zero on a wrong answer.
+``parse_credentials_reranked`` runs the registry after its counters were
+skewed towards the heuristic scan, as a run of unlabelled pages would.
+Pages without expected values (fresh captures) are timed and shown only:
+
+    python benchmarks/extractor_benchmark.py --min-time 0.2
+    python benchmarks/extractor_benchmark.py --captures ~/.telegram_api_getter/captures
+    python benchmarks/extractor_benchmark.py --export-captures benchmarks/corpus/v2
+"""
+import os
+import sys
+import json
+import time
+import argparse
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from telegram_api_getter import ExtractorRegistry, TelegramAppClientBase, default_extractors  # noqa: E402
+from telegram_api_getter.captures import CaptureStore  # noqa: E402
+
+CORPUS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'corpus')
+
+
+def latest_corpus(root: str = CORPUS_DIR) -> str:
+    versions = [name for name in os.listdir(root) if name.startswith('v') and name[1:].isdigit()]
+    if not versions:
+        raise FileNotFoundError(f"No corpus versions under {root}")
+    return os.path.join(root, max(versions, key=lambda name: int(name[1:])))
+
+
+def load_corpus(directory: str) -> Dict[str, Any]:
+    with open(os.path.join(directory, 'manifest.json'), 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    for name, expected in manifest['pages'].items():
+        with open(os.path.join(directory, name), 'r', encoding='utf-8') as f:
+            expected['content'] = f.read()
+    return manifest
+
+
+def load_captures(directory: str) -> Dict[str, Any]:
+    store = CaptureStore(directory)
+    return {'version': 'captures', 'pages': {name: {'content': content} for name, content in store.iter_pages()}}
+
+
+def as_fields(credentials) -> Optional[Dict[str, str]]:
+    if credentials is None:
+        return None
+    return {'apiId': credentials.apiId, 'apiHash': credentials.apiHash}
+
+
+def reranked_extractors() -> ExtractorRegistry:
+    """Counters as after many unlabelled pages: heuristics cheap and hitting, labelled readers missing"""
+    registry = default_extractors()
+    for strategy in registry.strategies:
+        for _ in range(20):
+            registry.record(strategy.name, 0.01 if strategy.tier else 50.0, hit=bool(strategy.tier))
+    return registry
+
+
+def quiet_client(extractors: ExtractorRegistry) -> TelegramAppClientBase:
+    client = TelegramAppClientBase(extractors=extractors)
+    client.log = lambda text: None
+    return client
+
+
+def parsers(client: TelegramAppClientBase, reranked: TelegramAppClientBase) -> Dict[str, Tuple[Callable[[str], Any], str]]:
+    """Parser name -> (callable, manifest key it is checked against)"""
+    return {
+        'extract_csrf_token': (client.extract_csrf_token, 'csrf_token'),
+        'extract_hash_value': (client.extract_hash_value, 'hash'),
+        'parse_credentials': (lambda content: as_fields(client.parse_credentials(content)), 'credentials'),
+        'parse_credentials_reranked': (lambda content: as_fields(reranked.parse_credentials(content)), 'credentials'),
+        'extract_credentials_manual': (lambda content: as_fields(client.extract_credentials_manual(content)), 'credentials'),
+    }
+
+
+def time_call(func: Callable[[str], Any], content: str, min_time: float) -> float:
+    """Seconds per call, repeating until ``min_time`` has elapsed"""
+    calls = 0
+    started = time.perf_counter()
+    while True:
+        func(content)
+        calls += 1
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_time:
+            return elapsed / calls
+
+
+def run_benchmark(args) -> Dict[str, Any]:
+    if args.captures:
+        directory = args.captures
+        manifest = load_captures(directory)
+    else:
+        directory = args.corpus or latest_corpus()
+        manifest = load_corpus(directory)
+    # Fresh in-memory counters so a stats file cannot skew the ordering
+    client = quiet_client(default_extractors())
+    reranked = quiet_client(reranked_extractors())
+
+    results: List[Dict[str, Any]] = []
+    for page, expected in manifest['pages'].items():
+        content = expected['content']
+        size = len(content.encode('utf-8'))
+        for name, (func, key) in parsers(client, reranked).items():
+            if args.only and name not in args.only:
+                continue
+            got = func(content)
+            seconds = time_call(func, content, args.min_time)
+            results.append({
+                'page': page,
+                'bytes': size,
+                'parser': name,
+                'correct': got == expected[key] if key in expected else None,
+                'got': got,
+                'expected': expected.get(key),
+                'us_per_call': seconds * 1e6,
+                'ns_per_byte': seconds * 1e9 / max(size, 1),
+            })
+    return {'corpus': directory, 'version': manifest.get('version'), 'results': results}
+
+
+def print_report(report: Dict[str, Any]):
+    print(f"corpus {report['corpus']} (version {report['version']})")
+    print(f"{'page':<18}{'bytes':>9}  {'parser':<28}{'ok':<4}{'us/call':>11}{'ns/byte':>10}")
+    verdicts = {True: 'yes', False: 'NO', None: '-'}
+    for row in report['results']:
+        print(
+            f"{row['page']:<18}{row['bytes']:>9}  {row['parser']:<28}{verdicts[row['correct']]:<4}"
+            f"{row['us_per_call']:>11.1f}{row['ns_per_byte']:>10.2f}"
+        )
+    for row in report['results']:
+        if row['correct'] is None and row['got'] is not None:
+            print(f"unchecked: {row['parser']} on {row['page']}: got {row['got']!r}")
+        elif row['correct'] is False:
+            print(f"wrong: {row['parser']} on {row['page']}: got {row['got']!r}, expected {row['expected']!r}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='Page parser correctness and speed over the page corpus')
+    parser.add_argument('--corpus', help='corpus directory (default: newest corpus/v<N>)')
+    parser.add_argument('--min-time', type=float, default=0.1, help='seconds to time each parser per page')
+    parser.add_argument('--captures', help='run over a capture directory instead of the corpus')
+    parser.add_argument('--export-captures', metavar='DIR', help='turn the captures into a new corpus directory and exit')
+    parser.add_argument('--only', action='append', help='run just this parser; repeatable')
+    parser.add_argument('--json', action='store_true', help='print the report as JSON')
+    args = parser.parse_args(argv)
+
+    if args.export_captures:
+        name = os.path.basename(os.path.normpath(args.export_captures))
+        version = int(name[1:]) if name[1:].isdigit() else None
+        count = CaptureStore(args.captures).export_corpus(args.export_captures, version)
+        print(f"Exported {count} captures to {args.export_captures}; fill in the expected values in manifest.json")
+        return 0
+
+    report = run_benchmark(args)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+    return 0 if all(row['correct'] is not False for row in report['results']) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,309 @@
+"""Local stand-in for my.telegram.org covering the routes TelegramAppRoutes uses.
+
+Latency, failures and page markup are configurable so the client can be
+load-tested without touching the real site:
+
+    python benchmarks/fake_server.py --port 8080 --latency 0.05 --variant form_group
+
+Every phone number signs in with ``FakeTelegramConfig.code``.
+"""
+import sys
+import json
+import time
+import random
+import string
+import argparse
+import threading
+from dataclasses import dataclass, field
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+from urllib.parse import parse_qs
+
+PAGE_VARIANTS = ('form_group', 'span_id', 'bare')
+
+
+@dataclass
+class FakeTelegramConfig:
+    code: str = '12345'
+    latency: float = 0.0
+    latency_jitter: float = 0.0
+    failure_rate: float = 0.0
+    variant: str = 'form_group'
+    ready_delay: float = 0.0
+    padding_bytes: int = 60_000
+    csrf: bool = False
+    create_returns_page: bool = False
+    retry_after: Optional[int] = None
+
+
+@dataclass
+class FakeAccount:
+    random_hash: str = ''
+    create_hash: str = ''
+    api_id: Optional[str] = None
+    api_hash: Optional[str] = None
+    created_at: float = 0.0
+
+
+@dataclass
+class FakeTelegramState:
+    accounts: Dict[str, FakeAccount] = field(default_factory=dict)
+    tokens: Dict[str, str] = field(default_factory=dict)
+    requests: Dict[str, int] = field(default_factory=dict)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def count(self, route: str):
+        with self.lock:
+            self.requests[route] = self.requests.get(route, 0) + 1
+
+
+def random_token(length: int = 32, alphabet: str = string.ascii_lowercase + string.digits) -> str:
+    return ''.join(random.choices(alphabet, k=length))
+
+
+def padding(size: int) -> str:
+    # Page chrome without digit or hex runs, so only the real fields can match
+    block = '<p class="text-muted">Telegram API development tools and documentation links.</p>\n'
+    return block * max(0, size // len(block))
+
+
+def login_page(config: FakeTelegramConfig) -> str:
+    csrf = f'<input type="hidden" name="csrf_token" value="{random_token()}">' if config.csrf else ''
+    return (
+        '<!DOCTYPE html><html><head><title>Telegram</title></head><body>'
+        f'<form id="my_login_form">{csrf}<input type="text" name="phone"></form>'
+        f'{padding(config.padding_bytes // 4)}</body></html>'
+    )
+
+
+def create_form_page(account: FakeAccount, config: FakeTelegramConfig) -> str:
+    platforms = ''.join(
+        f'<label><input type="radio" name="app_platform" value="{value}"> {value}</label>'
+        for value in ('android', 'ios', 'wp', 'bb', 'desktop', 'web', 'ubp', 'other')
+    )
+    return (
+        '<!DOCTYPE html><html><head><title>Create new application</title></head><body>'
+        f'{padding(config.padding_bytes // 2)}'
+        '<form id="app_create_form">'
+        f'<input type="hidden" name="hash" value="{account.create_hash}"/>'
+        '<input name="app_title"><input name="app_shortname"><input name="app_url">'
+        f'{platforms}<textarea name="app_desc"></textarea>'
+        '<button onclick="createApp();">Create application</button></form>'
+        f'{padding(config.padding_bytes // 2)}</body></html>'
+    )
+
+
+def credentials_block(account: FakeAccount, variant: str) -> str:
+    if variant == 'span_id':
+        return (
+            f'<div><label for="app_id">App api_id:</label><span id="app_id">{account.api_id}</span></div>'
+            f'<div><label for="app_hash">App api_hash:</label><span id="app_hash">{account.api_hash}</span></div>'
+        )
+    if variant == 'bare':
+        return f'<div class="app">api_id section<p>{account.api_id}</p><p>{account.api_hash}</p></div>'
+    return (
+        '<div class="form-group">\n'
+        '  <label for="app_id" class="col-md-4 text-right control-label">App api_id:</label>\n'
+        '  <div class="col-md-7">\n'
+        f'    <span class="form-control input-xlarge uneditable-input" onclick="this.select();"><strong>{account.api_id}</strong></span>\n'
+        '  </div>\n'
+        '</div>\n'
+        '<div class="form-group">\n'
+        '  <label for="app_hash" class="col-md-4 text-right control-label">App api_hash:</label>\n'
+        '  <div class="col-md-7">\n'
+        f'    <span class="form-control input-xlarge uneditable-input" onclick="this.select();">{account.api_hash}</span>\n'
+        '  </div>\n'
+        '</div>\n'
+    )
+
+
+def app_page(account: FakeAccount, config: FakeTelegramConfig) -> str:
+    return (
+        '<!DOCTYPE html><html><head><title>App configuration</title></head><body>'
+        f'<h2>App configuration</h2>{credentials_block(account, config.variant)}'
+        f'{padding(config.padding_bytes)}</body></html>'
+    )
+
+
+class FakeTelegramHandler(BaseHTTPRequestHandler):
+    server_version = 'FakeTelegram/1.0'
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    @property
+    def config(self) -> FakeTelegramConfig:
+        return self.server.config
+
+    @property
+    def state(self) -> FakeTelegramState:
+        return self.server.state
+
+    def log_message(self, format, *args):
+        pass
+
+    def read_form(self) -> Dict[str, str]:
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length).decode('utf-8') if length else ''
+        return {key: values[0] for key, values in parse_qs(body).items()}
+
+    def cookies(self) -> Dict[str, str]:
+        cookie = SimpleCookie(self.headers.get('Cookie', ''))
+        return {key: morsel.value for key, morsel in cookie.items()}
+
+    def respond(self, status: int, body: str = '', content_type: str = 'text/html; charset=utf-8', headers: Optional[Dict[str, str]] = None):
+        payload = body.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(payload)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def simulate_network(self) -> bool:
+        """Apply latency; return False when this request should fail"""
+        delay = self.config.latency + random.uniform(0, self.config.latency_jitter)
+        if delay:
+            time.sleep(delay)
+        if self.config.failure_rate and random.random() < self.config.failure_rate:
+            self.respond(503, 'Service temporarily unavailable', 'text/plain')
+            return False
+        return True
+
+    def current_account(self) -> Optional[FakeAccount]:
+        phone = self.state.tokens.get(self.cookies().get('stel_token', ''))
+        return self.state.accounts.get(phone) if phone else None
+
+    def do_GET(self):
+        path = self.path.split('?', 1)[0]
+        self.state.count(f'GET {path}')
+        if not self.simulate_network():
+            return
+        
+        if path == '/auth/login' or path == '/auth':
+            self.respond(200, login_page(self.config), headers={'Set-Cookie': f'stel_ssid={random_token(16)}; Path=/'})
+        elif path == '/apps':
+            account = self.current_account()
+            if account is None:
+                self.respond(302, headers={'Location': '/auth'})
+            elif account.api_id and time.monotonic() >= account.created_at + self.config.ready_delay:
+                self.respond(200, app_page(account, self.config))
+            elif account.api_id:
+                headers = {'Retry-After': str(self.config.retry_after)} if self.config.retry_after is not None else None
+                self.respond(200, create_form_page(account, self.config), headers=headers)
+            else:
+                account.create_hash = random_token(18)
+                self.respond(200, create_form_page(account, self.config))
+        else:
+            self.respond(404, 'Not found', 'text/plain')
+
+    def do_POST(self):
+        path = self.path.split('?', 1)[0]
+        self.state.count(f'POST {path}')
+        form = self.read_form()
+        if not self.simulate_network():
+            return
+        
+        if path == '/auth/send_password':
+            phone = form.get('phone', '')
+            if not phone.isdigit():
+                self.respond(200, 'Invalid phone number', 'text/plain')
+                return
+            with self.state.lock:
+                account = self.state.accounts.setdefault(phone, FakeAccount())
+                account.random_hash = random_token(18)
+            self.respond(200, json.dumps({'random_hash': account.random_hash}), 'application/json')
+        elif path == '/auth/login':
+            account = self.state.accounts.get(form.get('phone', ''))
+            if account is None or form.get('random_hash') != account.random_hash or form.get('password') != self.config.code:
+                self.respond(200, 'Invalid confirmation code!', 'text/plain')
+                return
+            token = random_token()
+            with self.state.lock:
+                self.state.tokens[token] = form['phone']
+            self.respond(200, 'true', 'text/plain', headers={'Set-Cookie': f'stel_token={token}; Path=/; HttpOnly'})
+        elif path == '/apps/create':
+            account = self.current_account()
+            if account is None or form.get('hash') != account.create_hash:
+                self.respond(200, 'ERROR', 'text/plain')
+                return
+            if not account.api_id:
+                account.api_id = str(random.randint(1_000_000, 99_999_999))
+                account.api_hash = random_token(32, '0123456789abcdef')
+                account.created_at = time.monotonic()
+            if self.config.create_returns_page and not self.config.ready_delay:
+                self.respond(200, app_page(account, self.config))
+            else:
+                self.respond(200, '', 'text/plain')
+        else:
+            self.respond(404, 'Not found', 'text/plain')
+
+
+class FakeTelegramServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, config: Optional[FakeTelegramConfig] = None, host: str = '127.0.0.1', port: int = 0):
+        self.config = config or FakeTelegramConfig()
+        self.state = FakeTelegramState()
+        super().__init__((host, port), FakeTelegramHandler)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def handle_error(self, request, client_address):
+        # Streaming clients hang up once they have what they need
+        if isinstance(sys.exc_info()[1], ConnectionError):
+            return
+        super().handle_error(request, client_address)
+
+    def start(self) -> 'FakeTelegramServer':
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='Local my.telegram.org stand-in')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--code', default='12345')
+    parser.add_argument('--latency', type=float, default=0.0)
+    parser.add_argument('--latency-jitter', type=float, default=0.0)
+    parser.add_argument('--failure-rate', type=float, default=0.0)
+    parser.add_argument('--variant', choices=PAGE_VARIANTS, default='form_group')
+    parser.add_argument('--ready-delay', type=float, default=0.0)
+    parser.add_argument('--padding-bytes', type=int, default=60_000)
+    parser.add_argument('--csrf', action='store_true')
+    parser.add_argument('--create-returns-page', action='store_true')
+    args = parser.parse_args(argv)
+    
+    config = FakeTelegramConfig(
+        code=args.code,
+        latency=args.latency,
+        latency_jitter=args.latency_jitter,
+        failure_rate=args.failure_rate,
+        variant=args.variant,
+        ready_delay=args.ready_delay,
+        padding_bytes=args.padding_bytes,
+        csrf=args.csrf,
+        create_returns_page=args.create_returns_page,
+    )
+    server = FakeTelegramServer(config, args.host, args.port)
+    print(f"Serving fake my.telegram.org on {server.base_url} (code {config.code})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
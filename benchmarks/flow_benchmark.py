@@ -0,0 +1,181 @@
+"""End-to-end provisioning benchmark against the local fake server.
+
+Drives TelegramAppClient through ProvisioningFlow (the headless form of
+WorkerThread.run) and reports per-phase latency percentiles and throughput:
+
+    python benchmarks/flow_benchmark.py --runs 50 --concurrency 10 --latency 0.02
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from telegram_api_getter import (  # noqa: E402
+    TelegramApp, TelegramAppClient, TelegramAppPlatformTypes, ProvisioningFlow, ReadinessPolicy
+)
+from telegram_api_getter.transport import TransportConfig  # noqa: E402
+from fake_server import FakeTelegramConfig, FakeTelegramServer, PAGE_VARIANTS  # noqa: E402
+
+TIMED_METHODS = (
+    'resume_session', 'send_confirmation_code', 'sign_in',
+    'create_app_js_method', 'get_credentials_advanced', 'wait_for_credentials',
+)
+
+
+class PhaseRecorder:
+    def __init__(self):
+        self.samples: Dict[str, List[float]] = {}
+        self.lock = threading.Lock()
+
+    def add(self, phase: str, seconds: float):
+        with self.lock:
+            self.samples.setdefault(phase, []).append(seconds)
+
+
+class TimedClient(TelegramAppClient):
+    """TelegramAppClient that records how long each public call takes"""
+    def __init__(self, recorder: PhaseRecorder, transport: TransportConfig, verbose: bool = False):
+        super().__init__(transport=transport)
+        self.verbose = verbose
+        for name in TIMED_METHODS:
+            setattr(self, name, self.timed(name, getattr(self, name), recorder))
+
+    @staticmethod
+    def timed(name, method, recorder):
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                recorder.add(name, time.perf_counter() - start)
+        return wrapper
+
+    def log(self, text: str):
+        if self.verbose:
+            super().log(text)
+
+
+def percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered) + 0.5)) - 1))
+    return ordered[index]
+
+
+def summarize(samples: Dict[str, List[float]]) -> Dict[str, Dict[str, float]]:
+    return {
+        phase: {
+            'count': len(values),
+            'p50_ms': percentile(values, 50) * 1000,
+            'p90_ms': percentile(values, 90) * 1000,
+            'p99_ms': percentile(values, 99) * 1000,
+            'max_ms': max(values) * 1000,
+        }
+        for phase, values in samples.items() if values
+    }
+
+
+def run_benchmark(args) -> Dict:
+    config = FakeTelegramConfig(
+        latency=args.latency,
+        latency_jitter=args.latency_jitter,
+        failure_rate=args.failure_rate,
+        variant=args.variant,
+        ready_delay=args.ready_delay,
+        padding_bytes=args.padding_bytes,
+        create_returns_page=args.create_returns_page,
+    )
+    server = FakeTelegramServer(config).start()
+    recorder = PhaseRecorder()
+    failures = []
+    
+    app_params = TelegramApp(
+        app_title='Benchmark App',
+        app_shortname='benchapp',
+        app_url='https://example.com',
+        app_platform=TelegramAppPlatformTypes.OTHER
+    )
+    
+    def provision(index: int):
+        client = TimedClient(recorder, TransportConfig(http2=args.http2, retries=args.retries), args.verbose)
+        client.stream_pages = not args.no_stream
+        client.base_url = server.base_url
+        client.readiness = ReadinessPolicy(deadline=args.deadline)
+        phone = str(9_000_000_000 + index % args.accounts)
+        start = time.perf_counter()
+        try:
+            ProvisioningFlow(client, phone, app_params, lambda _: config.code, log=client.log).run()
+            recorder.add('total', time.perf_counter() - start)
+        except Exception as e:
+            failures.append(str(e))
+        finally:
+            client.session.close()
+    
+    started = time.perf_counter()
+    try:
+        with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+            list(pool.map(provision, range(args.runs)))
+    finally:
+        server.stop()
+    elapsed = time.perf_counter() - started
+    
+    return {
+        'runs': args.runs,
+        'concurrency': args.concurrency,
+        'failures': len(failures),
+        'failure_samples': failures[:5],
+        'wall_s': elapsed,
+        'throughput_per_s': (args.runs - len(failures)) / elapsed if elapsed else 0.0,
+        'server_requests': dict(server.state.requests),
+        'phases': summarize(recorder.samples),
+    }
+
+
+def print_report(report: Dict):
+    print(f"{report['runs']} runs, concurrency {report['concurrency']}, "
+          f"{report['failures']} failed, {report['wall_s']:.2f} s wall, "
+          f"{report['throughput_per_s']:.1f} runs/s")
+    print(f"{'phase':<26}{'count':>7}{'p50 ms':>10}{'p90 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    for phase, stats in report['phases'].items():
+        print(f"{phase:<26}{stats['count']:>7}{stats['p50_ms']:>10.1f}{stats['p90_ms']:>10.1f}"
+              f"{stats['p99_ms']:>10.1f}{stats['max_ms']:>10.1f}")
+    print('server requests: ' + ', '.join(f'{k}={v}' for k, v in sorted(report['server_requests'].items())))
+    for failure in report['failure_samples']:
+        print(f"failure: {failure}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='Provisioning flow benchmark against the fake server')
+    parser.add_argument('--runs', type=int, default=20)
+    parser.add_argument('--concurrency', type=int, default=4)
+    parser.add_argument('--accounts', type=int, default=1_000_000, help='distinct phone numbers; lower it to measure repeat runs')
+    parser.add_argument('--latency', type=float, default=0.0)
+    parser.add_argument('--latency-jitter', type=float, default=0.0)
+    parser.add_argument('--failure-rate', type=float, default=0.0)
+    parser.add_argument('--variant', choices=PAGE_VARIANTS, default='form_group')
+    parser.add_argument('--ready-delay', type=float, default=0.0)
+    parser.add_argument('--padding-bytes', type=int, default=60_000)
+    parser.add_argument('--create-returns-page', action='store_true')
+    parser.add_argument('--deadline', type=float, default=20.0)
+    parser.add_argument('--retries', type=int, default=2, help='transport retries for idempotent requests')
+    parser.add_argument('--http2', action='store_true', help='use the httpx HTTP/2 adapter')
+    parser.add_argument('--no-stream', action='store_true', help='read whole /apps pages instead of streaming')
+    parser.add_argument('--json', action='store_true', help='print the report as JSON')
+    parser.add_argument('-v', '--verbose', action='store_true')
+    args = parser.parse_args(argv)
+    
+    report = run_benchmark(args)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+    return 1 if report['failures'] == args.runs else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,69 @@
+"""Import-time budget for the headless core.
+
+Runs ``import telegram_api_getter`` in fresh interpreters and exits non-zero
+when the median exceeds the budget or a GUI/fallback dependency got loaded.
+
+    python benchmarks/import_time.py --budget-ms 250
+"""
+import os
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+FORBIDDEN_MODULES = ['PyQt5', 'pyperclip', 'bs4', 'aiohttp', 'cryptography', 'selenium', 'rich']
+
+PROBE = '''
+import sys, time, json
+start = time.perf_counter()
+import telegram_api_getter
+elapsed = time.perf_counter() - start
+print(json.dumps({
+    "ms": elapsed * 1000,
+    "loaded": [m for m in %r if m in sys.modules],
+}))
+''' % (FORBIDDEN_MODULES,)
+
+
+def measure(runs: int):
+    samples = []
+    loaded = set()
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, '-c', PROBE],
+            cwd=REPO_ROOT,
+            check=True,
+            capture_output=True,
+            text=True
+        ).stdout
+        result = json.loads(output)
+        samples.append(result['ms'])
+        loaded.update(result['loaded'])
+    return samples, sorted(loaded)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=7)
+    parser.add_argument('--budget-ms', type=float, default=float(os.environ.get('IMPORT_BUDGET_MS', 250)))
+    args = parser.parse_args(argv)
+    
+    samples, loaded = measure(args.runs)
+    median = statistics.median(samples)
+    print(f"import telegram_api_getter: median {median:.1f} ms, min {min(samples):.1f} ms over {args.runs} runs")
+    
+    failed = False
+    if loaded:
+        print(f"FAIL: core import pulled in {', '.join(loaded)}")
+        failed = True
+    if median > args.budget_ms:
+        print(f"FAIL: median import time above the {args.budget_ms:.0f} ms budget")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -4,12 +4,14 @@ import random
 import string
 import sys
 import os
+import argparse
+from dataclasses import dataclass, field
+from typing import List, Optional
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
+from selenium.common.exceptions import TimeoutException
 
 # UI Libraries
 from rich.console import Console
@@ -20,14 +22,111 @@ from rich.align import Align
 from rich.text import Text
 from pyfiglet import Figlet
 
+from telegram_api_getter import TelegramApp, TelegramAppClient, TelegramAppPlatformTypes
+from telegram_api_getter.tracing import Tracer
+from telegram_api_getter.chromedriver import DriverCache, resolve_chromedriver
+from telegram_api_getter.browser_pool import BrowserPool, profile_dir
+
 # Initialize Console
 console = Console()
 
+# Lean launch: no images/fonts (and no CSS when nobody looks at the page)
+LEAN_WINDOW_SIZE = "1024,768"
+BLOCKED_RESOURCE_PATTERNS = ['*.png', '*.jpg', '*.jpeg', '*.gif', '*.svg', '*.ico', '*.woff', '*.woff2', '*.ttf']
+LOGIN_WAIT_SECONDS = 600
+TOKEN_RECHECK_SECONDS = 5
+FORM_READY_TIMEOUT_MS = 20000
+
+# One round trip: wait for the form and createApp(), fill it, optionally submit.
+# Arguments: title, shortname, platform value, submit, timeout in ms, callback.
+FILL_FORM_SCRIPT = """
+var title = arguments[0], shortname = arguments[1], platform = arguments[2];
+var submit = arguments[3], timeoutMs = arguments[4], done = arguments[arguments.length - 1];
+var started = Date.now();
+
+function setValue(input, value) {
+    input.focus();
+    input.value = value;
+    input.dispatchEvent(new Event('input', {bubbles: true}));
+    input.dispatchEvent(new Event('change', {bubbles: true}));
+    return input.value;
+}
+
+function attempt() {
+    var fields = {
+        app_title: document.querySelector('input[name="app_title"]'),
+        app_shortname: document.querySelector('input[name="app_shortname"]'),
+        app_platform: document.querySelector('input[name="app_platform"][value="' + platform + '"]')
+    };
+    var missing = Object.keys(fields).filter(function (name) { return !fields[name]; });
+    var scriptReady = typeof createApp === 'function';
+    if ((missing.length || (submit && !scriptReady)) && Date.now() - started < timeoutMs) {
+        setTimeout(attempt, 100);
+        return;
+    }
+
+    var result = {title: null, shortname: null, platform: null, script_ready: scriptReady,
+                  submitted: false, missing: missing, error: null};
+    if (fields.app_title) result.title = setValue(fields.app_title, title);
+    if (fields.app_shortname) result.shortname = setValue(fields.app_shortname, shortname);
+    if (fields.app_platform) {
+        fields.app_platform.click();
+        result.platform = fields.app_platform.checked ? fields.app_platform.value : null;
+    }
+    if (submit && !missing.length && scriptReady) {
+        try {
+            createApp();
+            result.submitted = true;
+        } catch (e) {
+            result.error = String(e);
+        }
+    }
+    done(result);
+}
+
+attempt();
+"""
+
+@dataclass
+class FormFillResult:
+    """What FILL_FORM_SCRIPT found and changed on the create form"""
+    title: Optional[str] = None
+    shortname: Optional[str] = None
+    platform: Optional[str] = None
+    script_ready: bool = False
+    submitted: bool = False
+    missing: List[str] = field(default_factory=list)
+    error: Optional[str] = None
+
+    @property
+    def filled(self) -> bool:
+        return not self.missing and None not in (self.title, self.shortname, self.platform)
+
 class TelegramAppBot:
-    def __init__(self):
+    def __init__(self, safety_delay=0, tracer=None, handoff=True, lean=False, headless_submit=False, wait_for_enter=False,
+                 driver_path=None, use_webdriver_manager=False, account=None, keep_browser=False):
         self.base_url = "http://my.telegram.org"
         self.driver = None
         self.wait = None
+        self.safety_delay = safety_delay
+        self.tracer = tracer or Tracer.from_env()
+        self.runs = 0
+        self.checked_token = None
+        self.checked_at = 0.0
+        # Hand the signed-in session to the HTTP client instead of filling the form in Chrome
+        self.handoff = handoff
+        self.lean = lean
+        self.headless_submit = headless_submit
+        self.wait_for_enter = wait_for_enter
+        self.driver_path = driver_path
+        self.use_webdriver_manager = use_webdriver_manager
+        self.driver_resolution = None
+        # Persistent user-data-dir so the my.telegram.org login survives between runs
+        self.account = account
+        self.headless = False
+        # Keep Chrome alive between runs of a long-lived CLI session; one browser
+        # per account, since Chrome locks a profile directory to a single instance
+        self.pool = BrowserPool(self.launch_driver, size=1, warm_url=f"{self.base_url}/apps") if keep_browser else None
 
     def render_banner(self):
         """Renders the ASCII art header."""
@@ -42,25 +141,92 @@ class TelegramAppBot:
             subtitle="[dim]Coded by Arian Lavi[/dim]"
         ))
 
-    def setup_driver(self):
-        """Initializes Chrome with clean logging."""
-        with console.status("[bold green]Initializing WebDriver engine...[/bold green]", spinner="dots"):
-            options = webdriver.ChromeOptions()
-            options.add_argument("--log-level=3")
+    def build_options(self, account=None, headless=False):
+        options = webdriver.ChromeOptions()
+        options.add_argument("--log-level=3")
+        options.add_experimental_option('excludeSwitches', ['enable-logging'])
+        prefs = {}
+        
+        if account:
+            options.add_argument(f"--user-data-dir={profile_dir(account)}")
+            # Restore the last session on start, which keeps session cookies such as stel_token
+            prefs['session.restore_on_startup'] = 1
+        
+        if self.lean or headless:
+            # Hand control back at DOMContentLoaded instead of waiting for every asset
+            options.page_load_strategy = 'eager'
+            options.add_argument(f"--window-size={LEAN_WINDOW_SIZE}")
+            options.add_argument("--disable-extensions")
+            options.add_argument("--blink-settings=imagesEnabled=false")
+            prefs['profile.managed_default_content_settings.images'] = 2
+        else:
             options.add_argument("--start-maximized")
-            options.add_experimental_option('excludeSwitches', ['enable-logging'])
-            
+        if prefs:
+            options.add_experimental_option('prefs', prefs)
+        
+        if headless:
+            options.add_argument("--headless=new")
+            options.add_argument("--disable-gpu")
+        return options
+
+    def resolve_driver(self):
+        """Find chromedriver once per bot; the cache makes repeat launches offline"""
+        if self.driver_resolution is None:
+            with self.tracer.span('bot.resolve_driver'):
+                self.driver_resolution = resolve_chromedriver(self.driver_path, use_webdriver_manager=self.use_webdriver_manager)
+            console.log(f"[cyan]➜ Driver:[/cyan] {self.driver_resolution.describe()}")
+        return self.driver_resolution
+
+    def block_heavy_resources(self, driver, css=False):
+        """Drop image and font requests (and stylesheets if asked) through DevTools"""
+        patterns = BLOCKED_RESOURCE_PATTERNS + (['*.css'] if css else [])
+        try:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': patterns})
+        except Exception as e:
+            console.log(f"[yellow]! Resource blocking unavailable: {e}[/yellow]")
+
+    def launch_driver(self, account=None, headless=False):
+        """Start a Chrome instance on ``account``'s profile (also the pool's launcher)"""
+        resolution = self.resolve_driver()
+        driver = webdriver.Chrome(
+            service=Service(resolution.path) if resolution.path else Service(), 
+            options=self.build_options(account, headless)
+        )
+        if resolution.path is None:
+            # Remember what Selenium Manager picked so the next launch is offline
+            DriverCache().remember(resolution.chrome_version, driver.service.path)
+        if self.lean or headless:
+            self.block_heavy_resources(driver, css=headless)
+        return driver
+
+    def setup_driver(self, headless=False):
+        """Initializes Chrome with clean logging; returns True for a warm browser from the pool."""
+        with console.status("[bold green]Initializing WebDriver engine...[/bold green]", spinner="dots"):
             try:
-                self.driver = webdriver.Chrome(
-                    service=Service(ChromeDriverManager().install()), 
-                    options=options
-                )
+                warm = False
+                if self.pool and not headless:
+                    self.driver, warm = self.pool.acquire(self.account)
+                else:
+                    self.driver = self.launch_driver(self.account, headless)
+                self.headless = headless
                 self.wait = WebDriverWait(self.driver, 20)
-                console.log("[green]Driver hooked successfully.[/green]")
+                console.log("[green]Reusing warm browser.[/green]" if warm else "[green]Driver hooked successfully.[/green]")
+                return warm
             except Exception as e:
                 console.log(f"[red]Failed to launch driver: {e}[/red]")
                 sys.exit(1)
 
+    def release_driver(self):
+        """Hand Chrome back to the pool, still logged in, or quit it"""
+        driver, self.driver = self.driver, None
+        if driver is None:
+            return
+        if self.pool and not self.headless:
+            self.pool.release(self.account, driver)
+        else:
+            driver.quit()
+
     def generate_hash(self, length=20):
         # Logic from original source: alphanumeric random string
         chars = string.ascii_lowercase + string.digits
@@ -77,9 +243,69 @@ class TelegramAppBot:
 3. Navigate to [bold]API development tools[/bold].
 4. Stop when you see the 'Create new application' form.
         """
+        logged_in_is_enough = self.handoff or self.headless_submit
+        if logged_in_is_enough:
+            instructions = """
+[bold yellow]ATTENTION REQUIRED[/bold yellow]
+
+1. Browser is now open at [underline]my.telegram.org[/underline]
+2. Enter your phone number & confirmation code manually.
+3. Stop once you are logged in; the rest runs without the browser.
+        """
         
         console.print(Panel(instructions, title="Waiting for User", border_style="yellow"))
-        console.input("\n[bold blink]>> Press [ENTER] once you are on the Form page...[/bold blink]")
+        prompt = "logged in" if logged_in_is_enough else "on the Form page"
+        enter_prompt = f"\n[bold blink]>> Press [ENTER] once you are {prompt}...[/bold blink]"
+        if self.wait_for_enter:
+            console.input(enter_prompt)
+            return
+        
+        try:
+            with console.status(f"[bold yellow]Waiting until you are {prompt}...[/bold yellow]", spinner="dots"):
+                WebDriverWait(self.driver, LOGIN_WAIT_SECONDS, poll_frequency=0.5).until(self.ready_to_continue)
+        except TimeoutException:
+            console.log(f"[yellow]! Not detected after {LOGIN_WAIT_SECONDS // 60} minutes, falling back to ENTER.[/yellow]")
+            console.input(enter_prompt)
+            return
+        console.log(f"[green] Detected: {prompt}.[/green]")
+
+    def ready_to_continue(self, driver):
+        """WebDriverWait condition for leaving the manual phase"""
+        if self.handoff or self.headless_submit:
+            cookie = driver.get_cookie('stel_token')
+            return cookie is not None and self.token_is_live(driver, cookie['value'])
+        return len(driver.find_elements(By.NAME, 'app_title')) > 0
+
+    def token_is_live(self, driver, token):
+        """Check the stel_token against /apps; a persistent profile can restore a stale one"""
+        now = time.monotonic()
+        if token == self.checked_token and now - self.checked_at < TOKEN_RECHECK_SECONDS:
+            return False
+        self.checked_token, self.checked_at = token, now
+        
+        client = TelegramAppClient(tracer=self.tracer)
+        client.import_browser_cookies(driver.get_cookies())
+        try:
+            return client.session_valid(token)
+        except Exception:
+            return False
+        finally:
+            client.session.close()
+
+    def relaunch_headless(self):
+        """Carry the login over to a lean headless Chrome opened on the create form"""
+        cookies = self.driver.get_cookies()
+        self.driver.quit()
+        self.driver = None
+        
+        self.setup_driver(headless=True)
+        self.driver.get(self.base_url)
+        for cookie in cookies:
+            self.driver.add_cookie({
+                key: cookie[key] for key in ('name', 'value', 'domain', 'path', 'secure', 'expiry') if key in cookie
+            })
+        self.driver.get(f"{self.base_url}/apps")
+        console.log("[green] Continuing in headless Chrome.[/green]")
 
     def process_form(self):
         """Injects data and submits."""
@@ -93,57 +319,168 @@ class TelegramAppBot:
             console.log(f"[cyan]➜ Generated Title:[/cyan] [bold]{app_title}[/bold]")
             console.log(f"[cyan]➜ Generated Hash :[/cyan] [bold]{app_short}[/bold]")
 
-            # Targeting elements
-            # Logic matches source: fills input fields
-            t_input = self.wait.until(EC.visibility_of_element_located((By.NAME, 'app_title')))
-            s_input = self.driver.find_element(By.NAME, 'app_shortname')
-            
-            t_input.clear()
-            t_input.send_keys(app_title)
-            s_input.clear()
-            s_input.send_keys(app_short)
-            console.log("[green] Form fields populated.[/green]")
+            # Fill (and, without a safety delay, submit) in a single script execution
+            submit_now = not self.safety_delay
+            result = self.fill_form(app_title, app_short, submit=submit_now)
+            self.log_fill_result(result)
+            if not result.filled:
+                console.print(Panel("[bold red]Create form incomplete; nothing submitted.[/bold red]", border_style="red"))
+                return result
 
-            # Platform selection (Index 7)
-            # Logic matches source: selects 8th radio button
-            platforms = self.driver.find_elements(By.NAME, 'app_platform')
-            if len(platforms) > 7:
-                platforms[7].click()
-                console.log("[green] Platform 'Other' selected.[/green]")
-            else:
-                console.log("[red]! Warning: Platform list mismatch. Selecting default.[/red]")
-                platforms[-1].click()
-
-            # Safety Delay with Visual Progress Bar
-            # Logic matches source: 5000ms timeout
-            for _ in track(range(5), description="[bold yellow]Safety Delay (Anti-Flood)...[/bold yellow]"):
-                time.sleep(1)
+            # Optional Safety Delay with Visual Progress Bar
+            if not submit_now:
+                for _ in track(range(self.safety_delay), description="[bold yellow]Safety Delay (Anti-Flood)...[/bold yellow]"):
+                    time.sleep(1)
+                console.log("[bold magenta]>>> Executing createApp() JS payload...[/bold magenta]")
+                result.submitted = bool(self.driver.execute_script(
+                    "if (typeof createApp !== 'function') return false; createApp(); return true;"
+                ))
 
-            # Execution
-            console.log("[bold magenta]>>> Executing createApp() JS payload...[/bold magenta]")
-            self.driver.execute_script("createApp();")
-            
-            console.print(Panel("[bold green]SUCCESS: Application Created.[/bold green]", border_style="green"))
+            if result.submitted:
+                console.print(Panel("[bold green]SUCCESS: Application Created.[/bold green]", border_style="green"))
+            else:
+                console.print(Panel(f"[bold red]Form not submitted: {result.error or 'createApp() unavailable'}[/bold red]", border_style="red"))
+            return result
 
         except Exception as e:
             console.print_exception()
 
+    def fill_form(self, app_title, app_short, submit=True):
+        """Set title, short name and the 'Other' platform (and submit) in one driver call"""
+        raw = self.driver.execute_async_script(
+            FILL_FORM_SCRIPT, app_title, app_short, TelegramAppPlatformTypes.OTHER.value, submit, FORM_READY_TIMEOUT_MS
+        )
+        return FormFillResult(**raw)
+
+    def log_fill_result(self, result):
+        if result.title and result.shortname:
+            console.log("[green] Form fields populated.[/green]")
+        if result.platform:
+            console.log(f"[green] Platform '{result.platform}' selected.[/green]")
+        if result.missing:
+            console.log(f"[red]! Missing on the form: {', '.join(result.missing)}[/red]")
+        if result.error:
+            console.log(f"[red]! createApp() failed: {result.error}[/red]")
+
+    def handoff_session(self):
+        """Move the browser's stel_token session into a requests client and close Chrome"""
+        client = TelegramAppClient(tracer=self.tracer)
+        user_agent = self.driver.execute_script("return navigator.userAgent;")
+        token = client.import_browser_cookies(self.driver.get_cookies(), user_agent)
+        
+        kept = self.pool is not None
+        self.release_driver()
+        console.log("[green] Session handed over, browser kept for the next run.[/green]" if kept else "[green] Session handed over, browser closed.[/green]")
+        
+        if not token:
+            raise RuntimeError("No stel_token cookie found; is the login complete?")
+        return client, token
+
+    def create_over_http(self, client, token):
+        """Create the app and read the credentials back with the HTTP client"""
+        console.rule("[bold blue]Creating Application over HTTP[/bold blue]")
+        app_params = TelegramApp(
+            app_title=self.generate_hash(),
+            app_shortname=self.generate_hash(),
+            app_platform=TelegramAppPlatformTypes.OTHER,
+            app_url='https://example.com',
+            app_dsc='Created via API'
+        )
+        
+        with console.status("[bold green]Creating app and waiting for credentials...[/bold green]", spinner="dots"):
+            result = client.create_app_js_method(token, app_params)
+            if result.rejected:
+                console.print(Panel(f"[bold red]App creation failed: {result.error}[/bold red]", border_style="red"))
+                return None
+            if not result.success:
+                console.log(f"[yellow]! App creation reported: {result.error}[/yellow]")
+            credentials = result.credentials or client.wait_for_credentials(token)
+        
+        if not credentials:
+            console.print(Panel("[bold red]Credentials not found on /apps.[/bold red]", border_style="red"))
+            return None
+        
+        console.print(Panel(
+            f"[bold]api_id  :[/bold] {credentials.apiId}\n[bold]api_hash:[/bold] {credentials.apiHash}",
+            title="[bold green]SUCCESS[/bold green]",
+            border_style="green"
+        ))
+        return credentials
+
+    def render_timings(self):
+        summary = self.tracer.format_summary()
+        if summary:
+            console.print(Panel(summary, title="Timings", border_style="dim"))
+
     def run(self):
+        if self.runs:
+            # One tracer per run, so a --session run's timings do not include the previous runs
+            self.tracer = Tracer(sink=self.tracer.sink)
+        self.runs += 1
+        if self.pool:
+            # Launch (or keep warming) Chrome while the banner renders
+            self.pool.prewarm(self.account)
         self.render_banner()
-        self.setup_driver()
+        with self.tracer.span('bot.setup_driver'):
+            warm = self.setup_driver()
         
         try:
-            self.driver.get(self.base_url)
-            self.await_user_interaction()
-            self.process_form()
+            if not warm:
+                with self.tracer.span('bot.open_page'):
+                    self.driver.get(self.base_url)
+            with self.tracer.span('bot.user_interaction'):
+                self.await_user_interaction()
+            if self.handoff:
+                with self.tracer.span('bot.handoff'):
+                    client, token = self.handoff_session()
+                with self.tracer.span('bot.http_create'):
+                    self.create_over_http(client, token)
+                self.render_timings()
+                return
+            if self.headless_submit:
+                with self.tracer.span('bot.headless_relaunch'):
+                    self.relaunch_headless()
+            with self.tracer.span('bot.process_form'):
+                self.process_form()
+            self.render_timings()
             
             console.input("[dim]Press [Enter] to terminate session...[/dim]")
         except KeyboardInterrupt:
             console.print("\n[red]Session aborted by user.[/red]")
+        except RuntimeError as e:
+            console.print(f"[red]{e}[/red]")
         finally:
-            if self.driver:
-                self.driver.quit()
+            self.release_driver()
 
 if __name__ == "__main__":
-    bot = TelegramAppBot()
-    bot.run()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Create a my.telegram.org app after a manual browser login")
+    parser.add_argument('--browser-submit', action='store_true', help="fill and submit the form in Chrome instead of handing off to HTTP")
+    parser.add_argument('--lean', action='store_true', help="eager page loads, no images/fonts, smaller window")
+    parser.add_argument('--headless-submit', action='store_true', help="with --browser-submit, fill the form in a headless Chrome after login")
+    parser.add_argument('--driver', help="chromedriver to use (default: $TG_API_GETTER_CHROMEDRIVER, cache, PATH, Selenium Manager)")
+    parser.add_argument('--webdriver-manager', action='store_true', help="download the driver with webdriver-manager when none is found locally")
+    parser.add_argument('--wait-for-enter', action='store_true', help="continue on ENTER instead of detecting the login/form page")
+    parser.add_argument('--account', help="keep a Chrome profile for this account (phone number or any label) so the login carries over")
+    parser.add_argument('--session', action='store_true', help="keep Chrome running between runs and offer to run again")
+    args = parser.parse_args()
+    
+    bot = TelegramAppBot(
+        handoff=not (args.browser_submit or args.headless_submit),
+        lean=args.lean,
+        headless_submit=args.headless_submit,
+        wait_for_enter=args.wait_for_enter,
+        driver_path=args.driver,
+        use_webdriver_manager=args.webdriver_manager,
+        account=args.account,
+        keep_browser=args.session
+    )
+    try:
+        while True:
+            bot.run()
+            if not args.session or console.input("[dim]Run again with the same browser? [y/N] [/dim]").strip().lower() != 'y':
+                break
+    except KeyboardInterrupt:
+        console.print("\n[red]Session aborted by user.[/red]")
+    finally:
+        if bot.pool:
+            bot.pool.close()
\ No newline at end of file
@@ -1,429 +1,99 @@
 import sys
 import logging
-import re
-import requests
 import time
-import random
-import string
-from dataclasses import dataclass
-from typing import Optional, Dict, List
-from enum import Enum
+import threading
 
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout,
-    QLineEdit, QPushButton, QLabel, QMessageBox, QTextEdit,
+    QLineEdit, QPushButton, QLabel, QMessageBox, QPlainTextEdit,
     QHBoxLayout, QProgressBar, QFrame, QGridLayout, QComboBox,
     QInputDialog
 )
-from PyQt5.QtCore import QThread, pyqtSignal, Qt
+from PyQt5.QtCore import QThread, QTimer, pyqtSignal, Qt
 import pyperclip
-from bs4 import BeautifulSoup
 
-logging.basicConfig(
-    filename='app_log.txt',
-    level=logging.DEBUG,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S'
+from telegram_api_getter import (
+    TelegramApp, TelegramAppClient, TelegramAppPlatformTypes, ProvisioningFlow,
+    default_extractors
 )
+from telegram_api_getter.captures import CaptureStore
+from telegram_api_getter.tracing import Tracer
+from telegram_api_getter.logs import configure_logging
+from telegram_api_getter.transport import TransportConfig
+from telegram_api_getter.extractors import default_stats_path
+from telegram_api_getter.cancel import CancelToken, Cancelled, DeadlineExceeded
 
-class TelegramAppRoutes:
-    AUTH = '/auth/login'
-    APPS = '/apps'
-    CREATE_APP = '/apps/create'
-    SEND_PASSWORD = '/auth/send_password'
-
-class TelegramAppPlatformTypes(Enum):
-    ANDROID = 'android'
-    IOS = 'ios'
-    WINDOWS_PHONE = 'wp'
-    BLACKBERRY = 'bb'
-    DESKTOP = 'desktop'
-    WEB = 'web'
-    UBUNTU_PHONE = 'ubp'
-    OTHER = 'other'
-
-@dataclass
-class TelegramApp:
-    app_title: str
-    app_shortname: str
-    app_platform: TelegramAppPlatformTypes
-    app_url: Optional[str] = ''
-    app_dsc: Optional[str] = ''
-
-@dataclass
-class TelegramAppCredentials:
-    apiId: str
-    apiHash: str
-
-@dataclass
-class TelegramAppAuthParams:
-    phone: str
-    random_hash: str
-    code: str
-
-class TelegramAppClient:
-    def __init__(self):
-        self.session = requests.Session()
-        self.base_url = 'https://my.telegram.org'
-        self.cookie_name = 'stel_token'
-        
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'DNT': '1',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-        })
-
-    def log(self, text: str):
-        logging.info(text)
-        print(text)
-
-    def normalize_phone_number(self, phone_number: str) -> str:
-        phone = phone_number.strip().replace('+', '').replace('(', '').replace(')', '').replace('-', '').replace(' ', '')
-        if not phone.isdigit():
-            raise ValueError('Invalid phone number')
-        return phone
-
-    def extract_csrf_token(self, html_content: str) -> Optional[str]:
-        try:
-            patterns = [
-                r'name="csrf_token" value="([^"]+)"',
-                r'csrf_token["\']?\s*[:=]\s*["\']([^"\']+)["\']',
-                r'<meta[^>]*name=["\']csrf-token["\'][^>]*content=["\']([^"\']+)["\']',
-            ]
-            
-            for pattern in patterns:
-                match = re.search(pattern, html_content)
-                if match:
-                    return match.group(1)
-            
-            return None
-            
-        except Exception as e:
-            self.log(f"Error extracting CSRF token: {e}")
-            return None
-
-    def send_confirmation_code(self, phone_number: str) -> Optional[str]:
-        try:
-            phone = self.normalize_phone_number(phone_number)
-            
-            response = self.session.get(f'{self.base_url}{TelegramAppRoutes.AUTH}', timeout=30)
-            csrf_token = self.extract_csrf_token(response.text) or "default_csrf_token"
-            
-            data = {'phone': phone, 'csrf_token': csrf_token}
-            
-            headers = {
-                'Content-Type': 'application/x-www-form-urlencoded; charset=UTF-8',
-                'X-Requested-With': 'XMLHttpRequest',
-                'Referer': f'{self.base_url}{TelegramAppRoutes.AUTH}',
-                'Origin': self.base_url
-            }
-            
-            response = self.session.post(
-                f'{self.base_url}{TelegramAppRoutes.SEND_PASSWORD}',
-                data=data,
-                headers=headers,
-                timeout=30
-            )
-            
-            if response.status_code == 200:
-                try:
-                    response_data = response.json()
-                    if 'random_hash' in response_data:
-                        return response_data['random_hash']
-                except ValueError:
-                    if 'random_hash' in response.text:
-                        match = re.search(r'"random_hash":"([^"]+)"', response.text)
-                        if match:
-                            return match.group(1)
-            
-            return None
-                
-        except Exception as e:
-            self.log(f"Error sending confirmation code: {str(e)}")
-            return None
-
-    def sign_in(self, params: TelegramAppAuthParams) -> Optional[str]:
-        try:
-            phone = self.normalize_phone_number(params.phone)
-            
-            response = self.session.get(f'{self.base_url}{TelegramAppRoutes.AUTH}', timeout=30)
-            csrf_token = self.extract_csrf_token(response.text) or "default_csrf_token"
-            
-            data = {
-                'phone': phone,
-                'random_hash': params.random_hash,
-                'password': params.code,
-                'csrf_token': csrf_token
-            }
-            
-            headers = {
-                'Content-Type': 'application/x-www-form-urlencoded; charset=UTF-8',
-                'Referer': f'{self.base_url}{TelegramAppRoutes.AUTH}',
-                'Origin': self.base_url
-            }
-            
-            response = self.session.post(
-                f'{self.base_url}{TelegramAppRoutes.AUTH}',
-                data=data,
-                headers=headers,
-                timeout=30,
-                allow_redirects=True
-            )
-            
-            stel_token = None
-            if hasattr(response, 'cookies') and response.cookies:
-                stel_token = response.cookies.get(self.cookie_name)
-            
-            if not stel_token:
-                set_cookie = response.headers.get('Set-Cookie', '')
-                if 'stel_token=' in set_cookie:
-                    match = re.search(r'stel_token=([^;]+)', set_cookie)
-                    if match:
-                        stel_token = match.group(1)
-            
-            return stel_token
-                
-        except Exception as e:
-            self.log(f"Error signing in: {str(e)}")
-            return None
-
-    def create_app_js_method(self, token: str, app_params: TelegramApp) -> bool:
-        """Alternative method using JavaScript-like approach"""
-        try:
-
-            response = self.session.get(
-                f'{self.base_url}{TelegramAppRoutes.APPS}',
-                cookies={self.cookie_name: token},
-                timeout=30
-            )
-            
-            if response.status_code != 200:
-                return False
-            
-            random_text_selection = list('abcdefghijklmnopqrstuvwxyz0123456789')
-            random_title = ''.join(random.choices(random_text_selection, k=20))
-            random_shortname = ''.join(random.choices(random_text_selection, k=20))
-            
-            self.log(f"Generated random title: {random_title}")
-            self.log(f"Generated random shortname: {random_shortname}")
-            
-
-            soup = BeautifulSoup(response.text, 'html.parser')
-            hash_input = soup.find('input', {'name': 'hash'})
-            
-            if not hash_input:
-                match = re.search(r'name="hash" value="([^"]+)"', response.text)
-                if match:
-                    hash_value = match.group(1)
-                else:
-                    return False
-            else:
-                hash_value = hash_input.get('value', '')
-            
-
-            time.sleep(2)
-            
-
-            data = {
-                'hash': hash_value,
-                'app_title': random_title,
-                'app_shortname': random_shortname,
-                'app_url': 'https://example.com',
-                'app_platform': 'other',
-                'app_desc': 'Mobile application'
-            }
-            
-            headers = {
-                'Content-Type': 'application/x-www-form-urlencoded; charset=UTF-8',
-                'Referer': f'{self.base_url}{TelegramAppRoutes.APPS}',
-                'Origin': self.base_url
-            }
-            
-            response = self.session.post(
-                f'{self.base_url}{TelegramAppRoutes.CREATE_APP}',
-                data=data,
-                cookies={self.cookie_name: token},
-                headers=headers,
-                timeout=30
-            )
-            
-
-            return True
-                
-        except Exception as e:
-            self.log(f"Error in JS method app creation: {str(e)}")
-            return True
-
-    def get_credentials_advanced(self, token: str) -> Optional[TelegramAppCredentials]:
-        """Advanced method to extract credentials with multiple techniques"""
-        try:
-            response = self.session.get(
-                f'{self.base_url}{TelegramAppRoutes.APPS}',
-                cookies={self.cookie_name: token},
-                timeout=30
-            )
-            
-            if response.status_code != 200:
-                return None
-            
-            content = response.text
-            self.log(f"Page content length: {len(content)}")
-            
-
-            soup = BeautifulSoup(content, 'html.parser')
-            
-
-            patterns = [
-                # API ID patterns
-                (r'api_id["\']?[^>]*>([^<]+)<', 'apiId'),
-                (r'API ID[^>]*>([^<]+)<', 'apiId'),
-                (r'<span[^>]*id=["\']app_id["\'][^>]*>([^<]+)</span>', 'apiId'),
-                (r'<label[^>]*for=["\']app_id["\'][^>]*>[^<]*</label>[^<]*<span[^>]*>([^<]+)</span>', 'apiId'),
-                
-                # API Hash patterns
-                (r'api_hash["\']?[^>]*>([^<]+)<', 'apiHash'),
-                (r'API Hash[^>]*>([^<]+)<', 'apiHash'),
-                (r'<span[^>]*id=["\']app_hash["\'][^>]*>([^<]+)</span>', 'apiHash'),
-                (r'<label[^>]*for=["\']app_hash["\'][^>]*>[^<]*</label>[^<]*<span[^>]*>([^<]+)</span>', 'apiHash'),
-            ]
-            
-            result = {'apiId': '', 'apiHash': ''}
-            
-            for pattern, key in patterns:
-                matches = re.findall(pattern, content, re.IGNORECASE)
-                for match in matches:
-                    if match.strip():
-                        result[key] = match.strip()
-                        self.log(f"Found {key}: {result[key]}")
-                        break
-                if result['apiId'] and result['apiHash']:
-                    break
-            
-
-            if not result['apiId'] or not result['apiHash']:
-                form_groups = soup.find_all('div', class_='form-group')
-                for group in form_groups:
-                    label = group.find('label')
-                    if label:
-                        label_text = label.get_text().lower()
-                        if 'api id' in label_text or 'app_id' in label_text:
-                            span = group.find('span', class_='form-control')
-                            if span:
-                                result['apiId'] = span.get_text(strip=True)
-                        elif 'api hash' in label_text or 'app_hash' in label_text:
-                            span = group.find('span', class_='form-control')
-                            if span:
-                                result['apiHash'] = span.get_text(strip=True)
-            
-
-            if not result['apiId'] or not result['apiHash']:
-                # Look for numeric API ID (usually 7-8 digits)
-                api_id_match = re.search(r'\b(\d{7,8})\b', content)
-                if api_id_match:
-                    result['apiId'] = api_id_match.group(1)
-                
-                # Look for API Hash (32 character hex)
-                api_hash_match = re.search(r'\b([a-f0-9]{32})\b', content)
-                if api_hash_match:
-                    result['apiHash'] = api_hash_match.group(1)
-            
-            if 'api_id' not in content.lower() and 'app_id' not in content.lower():
-                self.log("API credentials section not found, might need to create app first")
-                return None
-            
-            if result['apiId'] and result['apiHash']:
-                return TelegramAppCredentials(
-                    apiId=result['apiId'],
-                    apiHash=result['apiHash']
-                )
-            
-            self.log("Trying manual inspection of page content...")
-            
-            with open('debug_page.html', 'w', encoding='utf-8') as f:
-                f.write(content)
-            
-            self.log("Page content saved to debug_page.html for manual inspection")
-            
-            return None
-                
-        except Exception as e:
-            self.log(f"Error getting credentials: {str(e)}")
-            return None
+LOG_PANEL_MAX_LINES = 2000
+LOG_FLUSH_INTERVAL_MS = 100
+# Whole-run budget, including the time spent typing the confirmation code
+RUN_DEADLINE_SECONDS = 900
 
+# One interactive login at a time: a small pool, quick connect failures
+GUI_TRANSPORT = TransportConfig(pool_connections=1, pool_maxsize=2, connect_timeout=10.0, read_timeout=30.0)
 
 class WorkerThread(QThread):
     update_result = pyqtSignal(str)
+    update_status = pyqtSignal(str)
+    update_timings = pyqtSignal(str)
     append_log = pyqtSignal(str)
     show_message = pyqtSignal(str, str)
     set_running = pyqtSignal(bool)
     set_progress = pyqtSignal(int, int)
     request_code_input = pyqtSignal(str)
 
-    def __init__(self, phone, app_title, app_shortname, app_url, app_platform='other'):
+    def __init__(self, phone, app_title, app_shortname, app_url, app_platform='other', readiness=None, session_store=None, transport=None, captures=None, deadline=RUN_DEADLINE_SECONDS):
         super().__init__()
         self.phone = phone
         self.app_title = app_title
         self.app_shortname = app_shortname
         self.app_url = app_url
         self.app_platform = TelegramAppPlatformTypes(app_platform)
-        self.client = TelegramAppClient()
+        self.client = TelegramAppClient(
+            session_store,
+            Tracer.from_env(),
+            transport or GUI_TRANSPORT,
+            default_extractors(default_stats_path())
+        )
+        if readiness is not None:
+            self.client.readiness = readiness
+        self.client.captures = captures
         self.verification_code = None
+        self.code_event = threading.Event()
+        self.cancel_token = CancelToken(deadline)
+        self.cancel_token.on_cancel(self.code_event.set)
+        self.client.use_cancel_token(self.cancel_token)
 
     def log(self, text):
         logging.info(text)
         self.append_log.emit(text)
 
     def set_verification_code(self, code):
+        """Hand the code to the waiting worker; None cancels the wait"""
         self.verification_code = code
+        self.code_event.set()
+
+    def cancel(self):
+        """Stop the run from the GUI thread; in-flight requests are cut"""
+        self.cancel_token.cancel('Cancelled by user')
+
+    def wait_for_code(self, phone):
+        self.request_code_input.emit(phone)
+        
+        self.log("Waiting for verification code...")
+        remaining = self.cancel_token.remaining()
+        timeout = 300 if remaining is None else max(min(300, remaining), 0)
+        if not self.code_event.wait(timeout=timeout):
+            self.cancel_token.check()
+            raise Exception("Verification code timeout")
+        self.cancel_token.check()
+        
+        return self.verification_code
 
     def run(self):
         self.set_running.emit(True)
         self.set_progress.emit(0, 0)
         
         try:
-
-            self.log("Sending confirmation code...")
-            random_hash = self.client.send_confirmation_code(self.phone)
-            
-            if not random_hash:
-                raise Exception("Failed to send confirmation code")
-            
-            self.log(f"Confirmation code sent. Random hash: {random_hash}")
-            
-
-            self.request_code_input.emit(self.phone)
-            
-            self.log("Waiting for verification code...")
-            timeout = 300
-            start_time = time.time()
-            
-            while self.verification_code is None and time.time() - start_time < timeout:
-                time.sleep(0.5)
-            
-            if self.verification_code is None:
-                raise Exception("Verification code timeout")
-            
-            self.log(f"Received verification code: {self.verification_code}")
-            
-            self.log("Signing in with verification code...")
-            auth_params = TelegramAppAuthParams(
-                phone=self.phone,
-                random_hash=random_hash,
-                code=self.verification_code
-            )
-            
-            token = self.client.sign_in(auth_params)
-            
-            if not token:
-                raise Exception("Failed to sign in")
-            
-            self.log(f"Signed in successfully. Token: {token}")
-            
-            self.log("Creating Telegram application with alternative method...")
             app_params = TelegramApp(
                 app_title=self.app_title,
                 app_shortname=self.app_shortname,
@@ -432,73 +102,29 @@ class WorkerThread(QThread):
                 app_dsc='Created via API'
             )
             
-            success = self.client.create_app_js_method(token, app_params)
-            
-            if not success:
-                self.log("App creation may have failed, but continuing...")
-            
-            self.log("Retrieving API credentials with advanced method...")
-            
-            credentials = None
-            for attempt in range(5):  
-                self.log(f"Attempt {attempt + 1} to get credentials...")
-                credentials = self.client.get_credentials_advanced(token)
-                if credentials:
-                    break
-                
-                time.sleep(3)
-                
-                if attempt % 2 == 0:
-                    self.log("Refreshing page...")
-                    time.sleep(2)
-            
-            if not credentials:
-
-                self.log("Final attempt: checking if app was created...")
-                response = self.client.session.get(
-                    f'{self.client.base_url}{TelegramAppRoutes.APPS}',
-                    cookies={self.client.cookie_name: token},
-                    timeout=30
-                )
-                
-                if response.status_code == 200:
-
-                    if 'application' in response.text.lower() or 'created' in response.text.lower():
-                        self.log("App seems to be created but credentials not found")
-                        credentials = self.extract_credentials_manual(response.text)
-            
-            if not credentials:
-                raise Exception("Failed to retrieve API credentials. The app may have been created but credentials are not accessible.")
+            flow = ProvisioningFlow(self.client, self.phone, app_params, self.wait_for_code, log=self.log)
+            credentials = flow.run()
             
             result = f"✅ Success!\nAPI ID: {credentials.apiId}\nAPI Hash: {credentials.apiHash}"
             self.update_result.emit(result)
-            self.log("API credentials retrieved successfully")
             self.show_message.emit("Success", result)
                 
+        except DeadlineExceeded as e:
+            self.log(f"Error: {e}")
+            self.show_message.emit("Error", f"Error: {e}")
+        except Cancelled as e:
+            self.log(str(e))
+            self.update_status.emit(f"⏹ {e}")
         except Exception as e:
             error_msg = f"Error: {str(e)}"
             self.log(error_msg)
             self.show_message.emit("Error", error_msg)
         finally:
+            self.update_timings.emit(self.client.tracer.format_summary())
             self.set_progress.emit(0, 1)
             self.set_running.emit(False)
             self.log("Process completed")
 
-    def extract_credentials_manual(self, html_content: str) -> Optional[TelegramAppCredentials]:
-        """Manual extraction as last resort"""
-        try:
-            numbers = re.findall(r'\b(\d{7,9})\b', html_content)
-            for num in numbers:
-                if len(num) >= 7:  # API ID is usually 7-8 digits
-                    hash_match = re.search(r'([a-f0-9]{32})', html_content[html_content.find(num):html_content.find(num)+200])
-                    if hash_match:
-                        return TelegramAppCredentials(apiId=num, apiHash=hash_match.group(1))
-            
-            return None
-        except Exception as e:
-            self.log(f"Error in manual extraction: {e}")
-            return None
-
 
 class TelegramAPIGetter(QMainWindow):
     def __init__(self):
@@ -508,6 +134,18 @@ class TelegramAPIGetter(QMainWindow):
         self.init_ui()
         self.worker = None
         self.current_credentials = ""
+        try:
+            # Optional: the session cache needs the cryptography package
+            from telegram_api_getter.sessions import SessionStore
+            self.session_store = SessionStore()
+        except Exception as e:
+            logging.warning(f"Session cache disabled: {e}")
+            self.session_store = None
+        try:
+            self.captures = CaptureStore()
+        except Exception as e:
+            logging.warning(f"Page captures disabled: {e}")
+            self.captures = None
 
     def init_ui(self):
         central = QWidget()
@@ -577,7 +215,7 @@ class TelegramAPIGetter(QMainWindow):
             QPushButton:hover { background: #4CA0EE; }
             QPushButton:disabled { background: #CCCCCC; }
         """)
-        self.start_button.clicked.connect(self.start_process)
+        self.start_button.clicked.connect(self.start_or_cancel)
         btn_layout.addWidget(self.start_button)
 
         self.copy_button = QPushButton("📋 Copy")
@@ -607,11 +245,19 @@ class TelegramAPIGetter(QMainWindow):
         self.result_label.setMinimumHeight(80)
         card_layout.addWidget(self.result_label)
 
+        self.timing_label = QLabel()
+        self.timing_label.setWordWrap(True)
+        self.timing_label.setStyleSheet("color: #666; font-family: monospace; font-size: 10px;")
+        self.timing_label.hide()
+        card_layout.addWidget(self.timing_label)
+
         card_layout.addWidget(QLabel("📊 Activity Log:"))
-        self.log_panel = QTextEdit()
+        self.log_panel = QPlainTextEdit()
         self.log_panel.setReadOnly(True)
+        self.log_panel.setMaximumBlockCount(LOG_PANEL_MAX_LINES)
+        self.log_panel.setUndoRedoEnabled(False)
         self.log_panel.setStyleSheet("""
-            QTextEdit {
+            QPlainTextEdit {
                 background: white;
                 border-radius: 8px;
                 border: 1px solid #e1e4e8;
@@ -621,6 +267,12 @@ class TelegramAPIGetter(QMainWindow):
         """)
         card_layout.addWidget(self.log_panel)
 
+        # Log lines are queued and inserted as one block per timer tick
+        self.pending_log_lines = []
+        self.log_flush_timer = QTimer(self)
+        self.log_flush_timer.setInterval(LOG_FLUSH_INTERVAL_MS)
+        self.log_flush_timer.timeout.connect(self.flush_log)
+
         layout.addWidget(card)
 
         footer = QLabel("⚠️ Using advanced methods to extract API credentials")
@@ -628,6 +280,14 @@ class TelegramAPIGetter(QMainWindow):
         footer.setAlignment(Qt.AlignCenter)
         layout.addWidget(footer)
 
+    def start_or_cancel(self):
+        if self.worker is not None and self.worker.isRunning():
+            self.start_button.setEnabled(False)
+            self.start_button.setText("⏳ Cancelling...")
+            self.worker.cancel()
+        else:
+            self.start_process()
+
     def start_process(self):
         phone = self.phone_input.text().strip()
         title = self.app_title_input.text().strip()
@@ -642,11 +302,15 @@ class TelegramAPIGetter(QMainWindow):
         self.start_button.setEnabled(False)
         self.copy_button.setEnabled(False)
         self.result_label.setText("🔄 Starting process...")
+        self.timing_label.hide()
+        self.pending_log_lines.clear()
         self.log_panel.clear()
 
-        self.worker = WorkerThread(phone, title, shortname, url, platform)
+        self.worker = WorkerThread(phone, title, shortname, url, platform, session_store=self.session_store, captures=self.captures)
         self.worker.append_log.connect(self.append_log)
         self.worker.update_result.connect(self.on_result)
+        self.worker.update_status.connect(self.result_label.setText)
+        self.worker.update_timings.connect(self.on_timings)
         self.worker.show_message.connect(self.show_message_box)
         self.worker.set_running.connect(self.on_set_running)
         self.worker.set_progress.connect(self.on_set_progress)
@@ -663,7 +327,7 @@ class TelegramAPIGetter(QMainWindow):
         
         if ok and code.strip():
             self.worker.set_verification_code(code.strip())
-            self.log_panel.append(f"[{time.strftime('%H:%M:%S')}] Verification code entered")
+            self.append_log("Verification code entered")
         else:
             self.worker.set_verification_code(None)
 
@@ -672,8 +336,24 @@ class TelegramAPIGetter(QMainWindow):
         self.result_label.setText(text)
         self.copy_button.setEnabled(True)
 
+    def on_timings(self, summary):
+        if summary:
+            self.timing_label.setText(f"⏱️ Timings\n{summary}")
+            self.timing_label.show()
+
     def append_log(self, text):
-        self.log_panel.append(f"[{time.strftime('%H:%M:%S')}] {text}")
+        self.pending_log_lines.append(text)
+        if not self.log_flush_timer.isActive():
+            self.log_flush_timer.start()
+
+    def flush_log(self):
+        self.log_flush_timer.stop()
+        if not self.pending_log_lines:
+            return
+        stamp = f"[{time.strftime('%H:%M:%S')}] "
+        lines = self.pending_log_lines[-LOG_PANEL_MAX_LINES:]
+        self.pending_log_lines = []
+        self.log_panel.appendPlainText(stamp + f"\n{stamp}".join(lines))
 
     def show_message_box(self, title, message):
         if title.lower() == "success":
@@ -682,7 +362,8 @@ class TelegramAPIGetter(QMainWindow):
             QMessageBox.critical(self, title, message)
 
     def on_set_running(self, running):
-        self.start_button.setEnabled(not running)
+        self.start_button.setEnabled(True)
+        self.start_button.setText("⏹ Cancel" if running else "🚀 Start Process")
         if not running:
             self.progress.setRange(0, 1)
 
@@ -692,6 +373,12 @@ class TelegramAPIGetter(QMainWindow):
         else:
             self.progress.setRange(min_val, max_val)
 
+    def closeEvent(self, event):
+        if self.worker is not None and self.worker.isRunning():
+            self.worker.cancel()
+            self.worker.wait(5000)
+        super().closeEvent(event)
+
     def copy_credentials(self):
         if self.current_credentials:
             try:
@@ -702,6 +389,7 @@ class TelegramAPIGetter(QMainWindow):
                 QMessageBox.information(self, "Copied", "Credentials copied to clipboard!")
 
 def main():
+    configure_logging('app_log.txt')
     app = QApplication(sys.argv)
     app.setStyle('Fusion')
     window = TelegramAPIGetter()
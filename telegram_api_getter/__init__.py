@@ -0,0 +1,38 @@
+"""Core of Telegram API Getter, importable without PyQt5 or Selenium.
+
+The asyncio client and the encrypted session store pull in aiohttp and
+cryptography, so they are only imported on first access.
+"""
+from .core import (
+    TelegramAppRoutes, TelegramAppPlatformTypes, TelegramApp,
+    TelegramAppCredentials, TelegramAppCreateResult, TelegramAppAuthParams,
+    ReadinessPolicy, ReadinessSchedule, TelegramAppClientBase, TelegramAppClient,
+    scan_credential_fields, iter_credential_pairs, rank_credential_pairs,
+    CredentialStreamScanner, default_extractors
+)
+from .extractors import ExtractorRegistry, ExtractorStrategy
+from .cancel import CancelToken, Cancelled, DeadlineExceeded
+from .flow import ProvisioningFlow
+
+_LAZY_EXPORTS = {
+    'AsyncTelegramAppClient': '.aio',
+    'SessionStore': '.sessions',
+}
+
+__all__ = [
+    'TelegramAppRoutes', 'TelegramAppPlatformTypes', 'TelegramApp',
+    'TelegramAppCredentials', 'TelegramAppCreateResult', 'TelegramAppAuthParams',
+    'ReadinessPolicy', 'ReadinessSchedule', 'TelegramAppClientBase', 'TelegramAppClient',
+    'scan_credential_fields', 'iter_credential_pairs', 'rank_credential_pairs',
+    'CredentialStreamScanner', 'default_extractors', 'ExtractorRegistry', 'ExtractorStrategy',
+    'CancelToken', 'Cancelled', 'DeadlineExceeded', 'ProvisioningFlow',
+    *_LAZY_EXPORTS,
+]
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        import importlib
+        module = importlib.import_module(_LAZY_EXPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
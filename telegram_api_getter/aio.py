@@ -0,0 +1,339 @@
+"""asyncio twin of TelegramAppClient built on aiohttp"""
+import json
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional, Tuple, TYPE_CHECKING
+
+import aiohttp
+
+from .core import (
+    TelegramApp, TelegramAppAuthParams, TelegramAppClientBase,
+    TelegramAppCreateResult, TelegramAppCredentials, TelegramAppRoutes,
+    ReadinessPolicy, CredentialStreamScanner
+)
+from .tracing import Tracer, traced, current_span, aiohttp_trace_config
+from .transport import TransportConfig
+from .extractors import ExtractorRegistry
+
+if TYPE_CHECKING:
+    from .sessions import SessionStore
+
+
+class AsyncTelegramAppClient(TelegramAppClientBase):
+    """asyncio twin of TelegramAppClient built on a pooled aiohttp session.
+
+    Pass a shared ``aiohttp.TCPConnector`` to run many logins over one
+    connection pool; each client still keeps its own cookie jar. From the
+    TransportConfig it uses the pool size, timeouts and GET retries; aiohttp
+    only speaks HTTP/1.1, so ``http2`` has no effect here.
+    """
+    def __init__(
+        self,
+        connector: Optional[aiohttp.BaseConnector] = None,
+        session_store: Optional['SessionStore'] = None,
+        tracer: Optional[Tracer] = None,
+        transport: Optional[TransportConfig] = None,
+        extractors: Optional[ExtractorRegistry] = None
+    ):
+        super().__init__(session_store, tracer, transport, extractors)
+        self._connector = connector
+        self.session: Optional[aiohttp.ClientSession] = None
+
+    async def __aenter__(self) -> 'AsyncTelegramAppClient':
+        self._ensure_session()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    def _ensure_session(self) -> aiohttp.ClientSession:
+        if self.session is None or self.session.closed:
+            owns_connector = self._connector is None
+            connector = self._connector or aiohttp.TCPConnector(limit=self.transport.pool_maxsize)
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                connector_owner=owns_connector,
+                headers=self.headers,
+                timeout=aiohttp.ClientTimeout(
+                    sock_connect=self.transport.connect_timeout,
+                    sock_read=self.transport.read_timeout
+                ),
+                trace_configs=[aiohttp_trace_config()],
+            )
+        return self.session
+
+    def request_timeout(self) -> aiohttp.ClientTimeout:
+        """Per-request timeout; a run deadline caps the whole request, not just each read"""
+        connect, read = super().request_timeout()
+        return aiohttp.ClientTimeout(total=self.cancel_token.remaining(), sock_connect=connect, sock_read=read)
+
+    async def before_retry(self, attempt: int, retry_after: Optional[str] = None) -> bool:
+        """Back off before GET retry ``attempt + 1``; False when retries or the deadline ran out"""
+        if attempt >= self.transport.retries:
+            return False
+        # Same schedule as urllib3: the first retry is immediate, then exponential
+        delay = 0.0 if attempt == 0 else self.transport.backoff_factor * 2 ** attempt
+        delay = max(delay, self.parse_retry_after(retry_after) or 0.0)
+        remaining = self.cancel_token.remaining()
+        if remaining is not None and remaining <= delay:
+            return False
+        await self.cancel_token.sleep_async(delay)
+        span = current_span()
+        if span is not None:
+            span.retries += 1
+        return True
+
+    @asynccontextmanager
+    async def get(self, url: str, **kwargs) -> AsyncIterator[aiohttp.ClientResponse]:
+        """session.get with the transport's retries, which urllib3 does for the blocking client"""
+        session = self._ensure_session()
+        attempt = 0
+        while True:
+            try:
+                response = await session.get(url, timeout=self.request_timeout(), **kwargs)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if not await self.before_retry(attempt):
+                    raise
+                attempt += 1
+                continue
+            
+            if response.status in self.transport.retry_statuses and await self.before_retry(attempt, response.headers.get('Retry-After')):
+                response.release()
+                attempt += 1
+                continue
+            
+            async with response:
+                yield response
+            return
+
+    async def close(self):
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+        self.save_extractor_stats()
+
+    @traced('resume_session')
+    async def resume_session(self, phone_number: str) -> Optional[str]:
+        if self.session_store is None:
+            return None
+        try:
+            phone = self.normalize_phone_number(phone_number)
+            saved = self.session_store.load(phone)
+            if not saved:
+                return None
+            
+            session = self._ensure_session()
+            session.cookie_jar.update_cookies(saved['cookies'])
+            
+            async with self.get(
+                f'{self.base_url}{TelegramAppRoutes.APPS}',
+                cookies={self.cookie_name: saved['token']},
+                allow_redirects=False
+            ) as response:
+                if response.status == 200:
+                    return saved['token']
+            
+            self.log("Saved session expired, signing in again")
+            self.session_store.delete(phone)
+            session.cookie_jar.clear()
+            return None
+                
+        except Exception as e:
+            self.log(f"Error resuming saved session: {str(e)}")
+            return None
+
+    def save_session(self, phone_number: str, token: str):
+        if self.session_store is None or self.session is None:
+            return
+        try:
+            cookies = {cookie.key: cookie.value for cookie in self.session.cookie_jar}
+            cookies[self.cookie_name] = token
+            self.session_store.save(self.normalize_phone_number(phone_number), token, cookies)
+        except Exception as e:
+            self.log(f"Error saving session: {str(e)}")
+
+    @traced('get_csrf_token')
+    async def get_csrf_token(self, refresh: bool = False) -> str:
+        if not refresh and self.csrf_cache_valid():
+            return self.csrf_token or "default_csrf_token"
+        
+        async with self.get(f'{self.base_url}{TelegramAppRoutes.AUTH}') as response:
+            return self.remember_csrf_token(await response.text())
+
+    @traced('send_confirmation_code')
+    async def send_confirmation_code(self, phone_number: str) -> Optional[str]:
+        try:
+            phone = self.normalize_phone_number(phone_number)
+            session = self._ensure_session()
+            
+            for refresh in (False, True):
+                data = {'phone': phone, 'csrf_token': await self.get_csrf_token(refresh)}
+                
+                async with session.post(
+                    f'{self.base_url}{TelegramAppRoutes.SEND_PASSWORD}',
+                    timeout=self.request_timeout(),
+                    data=data,
+                    headers=self.form_headers(TelegramAppRoutes.AUTH, xhr=True)
+                ) as response:
+                    status = response.status
+                    response_text = await response.text()
+                
+                if status == 200:
+                    try:
+                        response_data = json.loads(response_text)
+                        if 'random_hash' in response_data:
+                            return response_data['random_hash']
+                    except ValueError:
+                        random_hash = self.extract_random_hash(response_text)
+                        if random_hash:
+                            return random_hash
+                
+                if not self.csrf_rejected(status, response_text):
+                    break
+                self.log("CSRF token rejected, refreshing")
+                current_span().retries += 1
+            
+            return None
+                
+        except Exception as e:
+            # aiohttp reports the run deadline as asyncio.TimeoutError; surface it like the sync client does
+            self.cancel_token.check()
+            self.log(f"Error sending confirmation code: {str(e)}")
+            return None
+
+    @traced('sign_in')
+    async def sign_in(self, params: TelegramAppAuthParams) -> Optional[str]:
+        try:
+            phone = self.normalize_phone_number(params.phone)
+            session = self._ensure_session()
+            
+            for refresh in (False, True):
+                data = {
+                    'phone': phone,
+                    'random_hash': params.random_hash,
+                    'password': params.code,
+                    'csrf_token': await self.get_csrf_token(refresh)
+                }
+                
+                async with session.post(
+                    f'{self.base_url}{TelegramAppRoutes.AUTH}',
+                    timeout=self.request_timeout(),
+                    data=data,
+                    headers=self.form_headers(TelegramAppRoutes.AUTH),
+                    allow_redirects=True
+                ) as response:
+                    stel_token = None
+                    for hop in (*response.history, response):
+                        morsel = hop.cookies.get(self.cookie_name)
+                        if morsel is not None:
+                            stel_token = morsel.value
+                    
+                    if not stel_token:
+                        for cookie in session.cookie_jar:
+                            if cookie.key == self.cookie_name:
+                                stel_token = cookie.value
+                    
+                    if not stel_token:
+                        stel_token = self.extract_stel_token(response.headers.get('Set-Cookie', ''))
+                    
+                    if stel_token or not self.csrf_rejected(response.status, await response.text()):
+                        return stel_token
+                self.log("CSRF token rejected, refreshing")
+                current_span().retries += 1
+            
+            return None
+                
+        except Exception as e:
+            self.cancel_token.check()
+            self.log(f"Error signing in: {str(e)}")
+            return None
+
+    @traced('create_app_js_method')
+    async def create_app_js_method(self, token: str, app_params: TelegramApp) -> TelegramAppCreateResult:
+        try:
+            session = self._ensure_session()
+            
+            response, content, existing = await self.fetch_apps_page(token)
+            if response.status != 200:
+                return TelegramAppCreateResult(success=False, error=f"HTTP {response.status} from {TelegramAppRoutes.APPS}")
+            
+            existing = existing or self.find_credentials(content)
+            if existing:
+                self.log("App already exists, skipping creation")
+                return TelegramAppCreateResult(success=True, credentials=existing)
+            
+            hash_value = self.extract_hash_value(content)
+            if hash_value is None:
+                return TelegramAppCreateResult(success=False, error="App creation form hash not found")
+            
+            data = self.build_create_app_data(hash_value)
+            
+            if self.readiness.create_delay:
+                await self.cancel_token.sleep_async(self.readiness.create_delay)
+            
+
+            async with session.post(
+                f'{self.base_url}{TelegramAppRoutes.CREATE_APP}',
+                timeout=self.request_timeout(),
+                data=data,
+                cookies={self.cookie_name: token},
+                headers=self.form_headers(TelegramAppRoutes.APPS)
+            ) as response:
+                return self.parse_create_response(response.status, await response.text())
+                
+        except Exception as e:
+            self.cancel_token.check()
+            self.log(f"Error in JS method app creation: {str(e)}")
+            return TelegramAppCreateResult(success=False, error=str(e))
+
+    async def fetch_apps_page(self, token: str) -> Tuple[aiohttp.ClientResponse, str, Optional[TelegramAppCredentials]]:
+        """Streaming GET /apps; leaving the block early closes the unread connection"""
+        async with self.get(
+            f'{self.base_url}{TelegramAppRoutes.APPS}',
+            cookies={self.cookie_name: token}
+        ) as response:
+            if response.status != 200:
+                return response, '', None
+            if not self.stream_pages:
+                return response, await response.text(), None
+            
+            scanner = CredentialStreamScanner(response.charset or 'utf-8')
+            async for chunk in response.content.iter_chunked(self.stream_chunk_size):
+                if scanner.feed(chunk):
+                    self.log("Credentials found, closing stream")
+                    break
+            return response, scanner.text(), scanner.credentials()
+
+    @traced('get_credentials_advanced')
+    async def get_credentials_advanced(self, token: str) -> Optional[TelegramAppCredentials]:
+        try:
+            response, content, credentials = await self.fetch_apps_page(token)
+            
+            self.retry_after = self.parse_retry_after(response.headers.get('Retry-After'))
+            if response.status != 200:
+                return None
+            
+            return credentials or self.parse_credentials(content)
+                
+        except Exception as e:
+            self.cancel_token.check()
+            self.log(f"Error getting credentials: {str(e)}")
+            return None
+
+    @traced('wait_for_credentials')
+    async def wait_for_credentials(self, token: str, policy: Optional[ReadinessPolicy] = None) -> Optional[TelegramAppCredentials]:
+        schedule = (policy or self.readiness).start()
+        self.retry_after = None
+        attempt = 0
+        while True:
+            delay = schedule.next_delay(self.retry_after)
+            if delay is None:
+                return None
+            if delay:
+                await self.cancel_token.sleep_async(delay)
+            
+            attempt += 1
+            current_span().retries = attempt - 1
+            self.log(f"Attempt {attempt} to get credentials...")
+            credentials = await self.get_credentials_advanced(token)
+            if credentials:
+                return credentials
@@ -0,0 +1,127 @@
+"""Persistent Chrome profiles and a pool of live browsers for long CLI sessions.
+
+Nothing here imports selenium: the pool is handed a ``launch`` callable and
+only calls ``get``/``quit``/``window_handles`` on what it returns.
+"""
+import os
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, List, Optional, Tuple
+
+PROFILE_DIR_ENV = 'TG_API_GETTER_PROFILE_DIR'
+
+
+def profile_root() -> str:
+    return os.environ.get(PROFILE_DIR_ENV) or os.path.join(
+        os.path.expanduser('~'), '.telegram_api_getter', 'chrome-profiles'
+    )
+
+
+def profile_dir(account: str, root: Optional[str] = None) -> str:
+    """Chrome user-data-dir for ``account``; hashed so phone numbers do not show up as folder names"""
+    digest = hashlib.sha256(account.strip().encode('utf-8')).hexdigest()[:16]
+    path = os.path.join(root or profile_root(), digest)
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    return path
+
+
+class BrowserPool:
+    """Live browsers keyed by account, reused across runs instead of quit after each.
+
+    ``launch(account)`` starts a browser. Released browsers load ``warm_url``
+    in the background so the next run starts on a loaded page; at most
+    ``size`` idle browsers are kept and the oldest is quit first.
+    """
+    def __init__(self, launch: Callable[[Optional[str]], Any], size: int = 1, warm_url: Optional[str] = None):
+        self.launch = launch
+        self.size = max(size, 1)
+        self.warm_url = warm_url
+        self.idle: 'OrderedDict[Optional[str], Future]' = OrderedDict()
+        self.lock = threading.Lock()
+        self.executor = ThreadPoolExecutor(max_workers=self.size, thread_name_prefix='browser-warm')
+
+    def prewarm(self, account: Optional[str] = None):
+        """Start a browser for ``account`` in the background unless one is idle already"""
+        with self.lock:
+            if account in self.idle:
+                return
+            self.idle[account] = self.executor.submit(self._launch_warm, account)
+            evicted = self._trim()
+        self._quit_all(evicted)
+
+    def acquire(self, account: Optional[str] = None) -> Tuple[Any, bool]:
+        """(browser, warm): the idle browser for ``account`` if it is still alive, else a fresh launch"""
+        with self.lock:
+            future = self.idle.pop(account, None)
+        if future is not None:
+            try:
+                driver = future.result()
+            except Exception:
+                driver = None
+            if driver is not None and self.is_alive(driver):
+                return driver, True
+            self.quit(driver)
+        return self.launch(account), False
+
+    def release(self, account: Optional[str], driver: Any):
+        """Keep ``driver`` for the next run of ``account``"""
+        if not self.is_alive(driver):
+            self.quit(driver)
+            return
+        with self.lock:
+            replaced = self.idle.pop(account, None)
+            self.idle[account] = self.executor.submit(self._warm, driver)
+            evicted = self._trim()
+        self._quit_all(evicted + ([replaced] if replaced else []))
+
+    def close(self):
+        """Quit every idle browser"""
+        with self.lock:
+            futures = list(self.idle.values())
+            self.idle.clear()
+        for future in futures:
+            try:
+                self.quit(future.result())
+            except Exception:
+                pass
+        self.executor.shutdown(wait=False)
+
+    def _launch_warm(self, account: Optional[str]) -> Any:
+        return self._warm(self.launch(account))
+
+    def _warm(self, driver: Any) -> Any:
+        if self.warm_url:
+            try:
+                driver.get(self.warm_url)
+            except Exception:
+                pass
+        return driver
+
+    def _trim(self) -> List[Future]:
+        evicted = []
+        while len(self.idle) > self.size:
+            evicted.append(self.idle.popitem(last=False)[1])
+        return evicted
+
+    def _quit_all(self, futures: List[Future]):
+        for future in futures:
+            future.add_done_callback(lambda done: done.exception() is None and self.quit(done.result()))
+
+    @staticmethod
+    def is_alive(driver: Any) -> bool:
+        try:
+            driver.window_handles
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def quit(driver: Any):
+        if driver is None:
+            return
+        try:
+            driver.quit()
+        except Exception:
+            pass
@@ -0,0 +1,103 @@
+"""Cooperative cancellation and per-run deadlines for the provisioning flow"""
+import time
+import threading
+from typing import Callable, List, Optional, Tuple
+
+
+class Cancelled(BaseException):
+    """Raised at the next checkpoint once a run is cancelled.
+
+    Like asyncio.CancelledError it is a BaseException, so the client's
+    ``except Exception`` fallbacks cannot swallow it.
+    """
+
+
+class DeadlineExceeded(Cancelled):
+    pass
+
+
+class CancelToken:
+    """Shared by a run's caller and its client: cancel() from any thread, check() inside.
+
+    ``deadline`` is a budget in seconds for the whole run; request timeouts
+    shrink to what is left of it and sleeps end early when it runs out.
+    """
+    def __init__(self, deadline: Optional[float] = None):
+        self.deadline_at = time.monotonic() + deadline if deadline is not None else None
+        self.event = threading.Event()
+        self.reason: Optional[str] = None
+        self.callbacks: List[Callable[[], None]] = []
+        self.lock = threading.Lock()
+
+    def cancel(self, reason: str = 'Cancelled'):
+        with self.lock:
+            if self.event.is_set():
+                return
+            self.reason = reason
+            self.event.set()
+            callbacks = list(self.callbacks)
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception:
+                pass
+
+    def on_cancel(self, callback: Callable[[], None]):
+        """Run ``callback`` on cancellation (at once if already cancelled)"""
+        with self.lock:
+            if not self.event.is_set():
+                self.callbacks.append(callback)
+                return
+        callback()
+
+    def remaining(self) -> Optional[float]:
+        if self.deadline_at is None:
+            return None
+        return self.deadline_at - time.monotonic()
+
+    @property
+    def cancelled(self) -> bool:
+        if self.event.is_set():
+            return True
+        remaining = self.remaining()
+        if remaining is not None and remaining <= 0:
+            self.cancel('Deadline exceeded')
+            return True
+        return False
+
+    def check(self):
+        if self.cancelled:
+            if self.reason == 'Deadline exceeded':
+                raise DeadlineExceeded(self.reason)
+            raise Cancelled(self.reason)
+
+    def sleep(self, seconds: float):
+        """time.sleep that wakes up (and raises) on cancellation or deadline"""
+        self.check()
+        remaining = self.remaining()
+        if remaining is not None and seconds >= remaining:
+            self.event.wait(max(remaining, 0))
+            self.cancel('Deadline exceeded')
+        else:
+            self.event.wait(seconds)
+        self.check()
+
+    async def sleep_async(self, seconds: float, interval: float = 0.1):
+        """asyncio.sleep counterpart of sleep(), polling the token every ``interval``"""
+        import asyncio
+        end = time.monotonic() + seconds
+        while True:
+            self.check()
+            left = end - time.monotonic()
+            if left <= 0:
+                return
+            await asyncio.sleep(min(left, interval))
+
+    def timeout(self, timeout: Tuple[float, float]) -> Tuple[float, float]:
+        """(connect, read) timeout cut down to the time left before the deadline"""
+        self.check()
+        remaining = self.remaining()
+        if remaining is None:
+            return timeout
+        connect, read = timeout
+        return (min(connect, remaining), min(read, remaining))
@@ -0,0 +1,107 @@
+"""Compressed, size-bounded captures of pages the extractors could not parse.
+
+Captures replace the old debug_page.html dump: the page is handed to a
+background thread, gzipped into ``<run_id>-<attempt>-<label>.html.gz`` and
+the oldest captures are dropped once the directory exceeds its budget.
+"""
+import os
+import gzip
+import json
+import queue
+import atexit
+import threading
+from typing import Dict, Iterator, List, Optional, Tuple
+
+CAPTURE_DIR_ENV = 'TG_API_GETTER_CAPTURE_DIR'
+CAPTURE_SUFFIX = '.html.gz'
+
+class CaptureStore:
+    """Ring of gzipped page captures written off the calling thread"""
+    def __init__(self, directory: Optional[str] = None, max_bytes: int = 5 * 1024 * 1024, max_files: int = 100):
+        self.directory = directory or os.environ.get(CAPTURE_DIR_ENV) or os.path.join(
+            os.path.expanduser('~'), '.telegram_api_getter', 'captures'
+        )
+        os.makedirs(self.directory, mode=0o700, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.max_files = max_files
+        self.queue: queue.Queue = queue.Queue()
+        self.lock = threading.Lock()
+        self.thread: Optional[threading.Thread] = None
+        self.attempts: Dict[str, int] = {}
+
+    def capture(self, content: str, run_id: str, label: str = 'page') -> str:
+        """Queue a page for writing and return the file name it will get"""
+        with self.lock:
+            attempt = self.attempts[run_id] = self.attempts.get(run_id, 0) + 1
+            name = f'{run_id}-{attempt:03d}-{label}{CAPTURE_SUFFIX}'
+            if self.thread is None:
+                self.thread = threading.Thread(target=self._worker, name='capture-writer', daemon=True)
+                self.thread.start()
+                atexit.register(self.flush)
+        self.queue.put((name, content))
+        return name
+
+    def flush(self):
+        """Block until every queued capture is on disk"""
+        self.queue.join()
+
+    def _worker(self):
+        while True:
+            name, content = self.queue.get()
+            try:
+                self.write(name, content)
+                self.prune()
+            except Exception:
+                # A dead writer would leave flush() blocked on queue.join() at exit
+                pass
+            finally:
+                self.queue.task_done()
+
+    def write(self, name: str, content: str):
+        path = os.path.join(self.directory, name)
+        tmp_path = f'{path}.tmp'
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(gzip.compress(content.encode('utf-8'), compresslevel=6))
+        os.replace(tmp_path, path)
+
+    def entries(self) -> List[Tuple[float, int, str]]:
+        """(mtime, size, name) of every capture, oldest first"""
+        result = []
+        for name in os.listdir(self.directory):
+            if name.endswith(CAPTURE_SUFFIX):
+                stat = os.stat(os.path.join(self.directory, name))
+                result.append((stat.st_mtime, stat.st_size, name))
+        return sorted(result)
+
+    def prune(self):
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        while entries and (total > self.max_bytes or len(entries) > self.max_files):
+            _, size, name = entries.pop(0)
+            os.remove(os.path.join(self.directory, name))
+            total -= size
+
+    def iter_pages(self) -> Iterator[Tuple[str, str]]:
+        """(name, decompressed page) of every capture, oldest first"""
+        for _, _, name in self.entries():
+            with gzip.open(os.path.join(self.directory, name), 'rt', encoding='utf-8') as f:
+                yield name, f.read()
+
+    def export_corpus(self, directory: str, version: Optional[int] = None) -> int:
+        """Write the captures as an extractor corpus with a manifest to fill in.
+
+        Expected values are left out; the extractor benchmark reports those
+        pages without judging them until someone adds the right answers.
+        """
+        os.makedirs(directory, exist_ok=True)
+        manifest = {'version': version, 'pages': {}}
+        for name, content in self.iter_pages():
+            page = name[:-len(CAPTURE_SUFFIX)] + '.html'
+            with open(os.path.join(directory, page), 'w', encoding='utf-8', newline='') as f:
+                f.write(content)
+            manifest['pages'][page] = {'source': name}
+        with open(os.path.join(directory, 'manifest.json'), 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2)
+            f.write('\n')
+        return len(manifest['pages'])
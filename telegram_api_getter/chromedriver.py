@@ -0,0 +1,142 @@
+"""chromedriver lookup for main-v2.py that needs no network once a driver is known.
+
+Resolution order: an explicit path, the local cache keyed by the installed
+Chrome major version, a matching chromedriver on PATH, and finally Selenium
+Manager (or webdriver-manager when asked), whose result is cached for next time.
+"""
+import os
+import re
+import json
+import time
+import shutil
+import subprocess
+from dataclasses import dataclass
+from typing import Optional
+
+DRIVER_PATH_ENV = 'TG_API_GETTER_CHROMEDRIVER'
+VERSION_PATTERN = re.compile(r'(\d+)\.\d+\.\d+(?:\.\d+)?')
+
+CHROME_COMMANDS = [
+    'google-chrome', 'google-chrome-stable', 'chromium', 'chromium-browser', 'chrome',
+    '/Applications/Google Chrome.app/Contents/MacOS/Google Chrome',
+]
+WINDOWS_VERSION_KEYS = [
+    r'HKEY_CURRENT_USER\Software\Google\Chrome\BLBeacon',
+    r'HKEY_LOCAL_MACHINE\Software\Google\Chrome\BLBeacon',
+]
+
+@dataclass
+class DriverResolution:
+    """Where the driver came from; ``path`` is None when Selenium Manager picks it at launch"""
+    path: Optional[str]
+    source: str
+    chrome_version: Optional[str]
+    elapsed_ms: float
+
+    def describe(self) -> str:
+        version = f"Chrome {self.chrome_version}" if self.chrome_version else "Chrome version unknown"
+        return f"{self.source} ({version}) in {self.elapsed_ms:.0f} ms"
+
+
+def run_version_command(command) -> Optional[str]:
+    try:
+        output = subprocess.run(command, capture_output=True, text=True, timeout=5).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+    match = VERSION_PATTERN.search(output)
+    return match.group(0) if match else None
+
+
+def installed_chrome_version() -> Optional[str]:
+    if os.name == 'nt':
+        for key in WINDOWS_VERSION_KEYS:
+            version = run_version_command(['reg', 'query', key, '/v', 'version'])
+            if version:
+                return version
+        return None
+
+    for command in CHROME_COMMANDS:
+        if os.path.isabs(command) and not os.path.exists(command):
+            continue
+        if not os.path.isabs(command) and shutil.which(command) is None:
+            continue
+        version = run_version_command([command, '--version'])
+        if version:
+            return version
+    return None
+
+
+def major(version: Optional[str]) -> Optional[str]:
+    return version.split('.', 1)[0] if version else None
+
+
+class DriverCache:
+    """JSON map of Chrome major version -> chromedriver path"""
+    def __init__(self, directory: Optional[str] = None):
+        self.directory = directory or os.path.join(os.path.expanduser('~'), '.telegram_api_getter', 'drivers')
+        self.path = os.path.join(self.directory, 'drivers.json')
+
+    def load(self) -> dict:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def get(self, chrome_version: Optional[str]) -> Optional[str]:
+        path = self.load().get(major(chrome_version) or '')
+        if path and os.path.isfile(path) and os.access(path, os.X_OK):
+            return path
+        return None
+
+    def remember(self, chrome_version: Optional[str], driver_path: Optional[str]):
+        key = major(chrome_version)
+        if not key or not driver_path:
+            return
+        entries = self.load()
+        if entries.get(key) == driver_path:
+            return
+        entries[key] = driver_path
+        os.makedirs(self.directory, exist_ok=True)
+        tmp_path = f'{self.path}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(entries, f, indent=2)
+        os.replace(tmp_path, self.path)
+
+
+def resolve_chromedriver(
+    explicit_path: Optional[str] = None,
+    cache: Optional[DriverCache] = None,
+    use_webdriver_manager: bool = False
+) -> DriverResolution:
+    """Find a chromedriver, touching the network only when nothing local matches"""
+    started = time.perf_counter()
+    cache = cache or DriverCache()
+
+    def done(path, source, chrome_version=None):
+        return DriverResolution(path, source, chrome_version, (time.perf_counter() - started) * 1000)
+
+    explicit_path = explicit_path or os.environ.get(DRIVER_PATH_ENV)
+    if explicit_path:
+        if not os.path.isfile(explicit_path):
+            raise FileNotFoundError(f"chromedriver not found at {explicit_path}")
+        return done(explicit_path, 'explicit path')
+
+    chrome_version = installed_chrome_version()
+    cached = cache.get(chrome_version)
+    if cached:
+        return done(cached, 'cache', chrome_version)
+
+    on_path = shutil.which('chromedriver')
+    if on_path and chrome_version and major(run_version_command([on_path, '--version'])) == major(chrome_version):
+        cache.remember(chrome_version, on_path)
+        return done(on_path, 'PATH', chrome_version)
+
+    if use_webdriver_manager:
+        from webdriver_manager.chrome import ChromeDriverManager
+        path = ChromeDriverManager().install()
+        cache.remember(chrome_version, path)
+        return done(path, 'webdriver-manager', chrome_version)
+
+    # Selenium Manager resolves (and, offline, reuses) the driver when Chrome starts
+    return done(None, 'Selenium Manager', chrome_version)
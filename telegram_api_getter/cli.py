@@ -0,0 +1,104 @@
+"""Headless command-line front end running the same flow as the GUI"""
+import sys
+import argparse
+from typing import Optional
+
+from .core import TelegramApp, TelegramAppClient, TelegramAppPlatformTypes
+from .flow import ProvisioningFlow
+from .tracing import Tracer, TRACE_PATH_ENV
+from .logs import configure_logging
+from .transport import TransportConfig
+from .extractors import default_stats_path
+from .core import default_extractors
+from .cancel import CancelToken, Cancelled
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog='telegram-api-getter',
+        description='Sign in to my.telegram.org and print the api_id/api_hash of your account.'
+    )
+    parser.add_argument('phone', help='phone number of the account, e.g. +989123456789')
+    parser.add_argument('--title', default='My Telegram App', help='application title')
+    parser.add_argument('--shortname', default='myapp', help='application short name')
+    parser.add_argument('--url', default='https://example.com', help='application URL')
+    parser.add_argument(
+        '--platform',
+        default=TelegramAppPlatformTypes.OTHER.value,
+        choices=[e.value for e in TelegramAppPlatformTypes]
+    )
+    parser.add_argument('--no-session-cache', action='store_true', help='always sign in with a confirmation code')
+    parser.add_argument('--session-dir', help='directory of the encrypted session cache')
+    parser.add_argument('--deadline', type=float, help='seconds to wait for a new app to show up')
+    parser.add_argument('--run-deadline', type=float, help='give up on the whole run after this many seconds')
+    parser.add_argument('--trace', help=f'append per-phase timing spans as JSON lines (default: ${TRACE_PATH_ENV})')
+    parser.add_argument('--timings', action='store_true', help='print a per-phase timing summary to stderr')
+    parser.add_argument('--http2', action='store_true', help='use HTTP/2 (needs httpx[http2])')
+    parser.add_argument('--retries', type=int, default=2, help='retries for idempotent requests')
+    parser.add_argument('--read-timeout', type=float, default=30.0)
+    parser.add_argument('--extractor-stats', default=default_stats_path(), help='file keeping extractor hit rates between runs')
+    parser.add_argument('--capture-dir', help='where unparseable pages are saved (default: ~/.telegram_api_getter/captures)')
+    parser.add_argument('--no-capture', action='store_true', help='do not save pages the extractors could not read')
+    parser.add_argument('--log-file', help='also write a rotating, redacted log file')
+    parser.add_argument('-v', '--verbose', action='store_true', help='show progress on stderr')
+    return parser
+
+
+def prompt_code(phone: str) -> Optional[str]:
+    try:
+        code = input(f"Enter the confirmation code sent to {phone}: ").strip()
+    except EOFError:
+        return None
+    return code or None
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    configure_logging(args.log_file, level='DEBUG' if args.verbose else 'WARNING', console=True)
+    
+    session_store = None
+    if not args.no_session_cache:
+        from .sessions import SessionStore
+        session_store = SessionStore(args.session_dir)
+    
+    tracer = Tracer(sink=args.trace) if args.trace else Tracer.from_env()
+    transport = TransportConfig(http2=args.http2, retries=args.retries, read_timeout=args.read_timeout)
+    client = TelegramAppClient(session_store, tracer, transport, default_extractors(args.extractor_stats))
+    if args.deadline is not None:
+        client.readiness.deadline = args.deadline
+    client.use_cancel_token(CancelToken(args.run_deadline))
+    if not args.no_capture:
+        from .captures import CaptureStore
+        client.captures = CaptureStore(args.capture_dir)
+    
+    app_params = TelegramApp(
+        app_title=args.title,
+        app_shortname=args.shortname,
+        app_url=args.url,
+        app_platform=TelegramAppPlatformTypes(args.platform),
+        app_dsc='Created via API'
+    )
+    
+    try:
+        credentials = ProvisioningFlow(client, args.phone, app_params, prompt_code).run()
+    except KeyboardInterrupt:
+        print("Aborted", file=sys.stderr)
+        return 130
+    except Cancelled as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if args.timings:
+            print(tracer.format_summary(), file=sys.stderr)
+            print(client.extractors.format_summary(), file=sys.stderr)
+    
+    print(f"api_id={credentials.apiId}")
+    print(f"api_hash={credentials.apiHash}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,783 @@
+"""HTTP client for my.telegram.org with no GUI dependencies.
+
+BeautifulSoup is only imported when a fallback parse needs it.
+"""
+import re
+import time
+import codecs
+import random
+import logging
+from email.utils import parsedate_to_datetime
+from dataclasses import dataclass
+from typing import Optional, Dict, Iterator, List, Tuple, TYPE_CHECKING
+from enum import Enum
+
+import requests
+
+from .tracing import Tracer, traced, current_span, requests_response_hook
+from .transport import CancellableAdapter, TransportConfig, supported_encodings
+from .extractors import ExtractorRegistry, ExtractorStrategy
+from .cancel import CancelToken
+
+if TYPE_CHECKING:
+    from .sessions import SessionStore
+    from .captures import CaptureStore
+
+logger = logging.getLogger(__name__)
+
+class TelegramAppRoutes:
+    AUTH = '/auth/login'
+    APPS = '/apps'
+    CREATE_APP = '/apps/create'
+    SEND_PASSWORD = '/auth/send_password'
+
+class TelegramAppPlatformTypes(Enum):
+    ANDROID = 'android'
+    IOS = 'ios'
+    WINDOWS_PHONE = 'wp'
+    BLACKBERRY = 'bb'
+    DESKTOP = 'desktop'
+    WEB = 'web'
+    UBUNTU_PHONE = 'ubp'
+    OTHER = 'other'
+
+@dataclass
+class TelegramApp:
+    app_title: str
+    app_shortname: str
+    app_platform: TelegramAppPlatformTypes
+    app_url: Optional[str] = ''
+    app_dsc: Optional[str] = ''
+
+@dataclass
+class TelegramAppCredentials:
+    apiId: str
+    apiHash: str
+
+@dataclass
+class TelegramAppCreateResult:
+    success: bool
+    credentials: Optional[TelegramAppCredentials] = None
+    error: Optional[str] = None
+    # The server refused the request outright, so polling /apps cannot help
+    rejected: bool = False
+
+    def __bool__(self) -> bool:
+        return self.success
+
+@dataclass
+class TelegramAppAuthParams:
+    phone: str
+    random_hash: str
+    code: str
+
+@dataclass
+class ReadinessPolicy:
+    """How long to wait between /apps probes while a new app becomes visible"""
+    first_delay: float = 0.0
+    base_delay: float = 0.5
+    multiplier: float = 2.0
+    max_delay: float = 4.0
+    jitter: float = 0.25
+    deadline: float = 20.0
+    create_delay: float = 0.0
+
+    def start(self) -> 'ReadinessSchedule':
+        return ReadinessSchedule(self)
+
+class ReadinessSchedule:
+    """Exponential backoff with jitter, bounded by the policy's total deadline"""
+    def __init__(self, policy: ReadinessPolicy):
+        self.policy = policy
+        self.attempt = 0
+        self.started = time.monotonic()
+
+    def remaining(self) -> float:
+        return self.policy.deadline - (time.monotonic() - self.started)
+
+    def next_delay(self, retry_after: Optional[float] = None) -> Optional[float]:
+        """Delay before the next probe, or None once the deadline is spent"""
+        if self.attempt == 0:
+            delay = self.policy.first_delay
+        else:
+            delay = min(self.policy.max_delay, self.policy.base_delay * self.policy.multiplier ** (self.attempt - 1))
+            delay *= 1 + random.uniform(-self.policy.jitter, self.policy.jitter)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        self.attempt += 1
+        
+        remaining = self.remaining()
+        if remaining <= 0 or delay > remaining:
+            return None
+        return delay
+
+# Every labelled apiId/apiHash field layout seen on /apps (including the
+# form-group markup the soup fallback walks), folded into one alternation so a
+# page is scanned once; the named group says which key matched.
+CREDENTIAL_FIELD_PATTERN = re.compile(
+    r'(?:'
+    r'<label[^>]*for=["\']app_id["\'][^>]*>[^<]*</label>[^<]*(?:<div[^>]*>[^<]*)?<span[^>]*>\s*(?:<strong>\s*)?(?P<apiId>[^<]+)<'
+    r'|<span[^>]*id=["\']app_id["\'][^>]*>(?P<apiId_span>[^<]+)<'
+    r'|api_id["\']?[^>]*>(?P<apiId_attr>[^<]+)<'
+    r'|API ID[^>]*>(?P<apiId_text>[^<]+)<'
+    r'|<label[^>]*for=["\']app_hash["\'][^>]*>[^<]*</label>[^<]*(?:<div[^>]*>[^<]*)?<span[^>]*>\s*(?:<strong>\s*)?(?P<apiHash>[^<]+)<'
+    r'|<span[^>]*id=["\']app_hash["\'][^>]*>(?P<apiHash_span>[^<]+)<'
+    r'|api_hash["\']?[^>]*>(?P<apiHash_attr>[^<]+)<'
+    r'|API Hash[^>]*>(?P<apiHash_text>[^<]+)<'
+    r')',
+    re.IGNORECASE
+)
+CSRF_TOKEN_PATTERNS = [
+    re.compile(r'name="csrf_token" value="([^"]+)"'),
+    re.compile(r'csrf_token["\']?\s*[:=]\s*["\']([^"\']+)["\']'),
+    re.compile(r'<meta[^>]*name=["\']csrf-token["\'][^>]*content=["\']([^"\']+)["\']'),
+]
+CREDENTIAL_ANCHOR_PATTERN = re.compile(r'ap[ip][_ ](?:id|hash)', re.IGNORECASE)
+CREDENTIALS_SECTION_PATTERN = re.compile(r'ap[ip]_id', re.IGNORECASE)
+CREATE_HASH_PATTERN = re.compile(r'name="hash" value="([^"]+)"')
+# Maximal lowercase-hex runs; iter_credential_pairs sorts them into ids and
+# hashes, which is several times faster than an alternation tried at every offset
+CREDENTIAL_CANDIDATE_PATTERN = re.compile(r'[0-9a-f]{7,}')
+
+def scan_credential_fields(content: str) -> Dict[str, str]:
+    """Single pass over labelled fields, stopping once apiId and apiHash are found.
+
+    The cheap anchor pattern finds candidate spots; the full field pattern only
+    runs on a small window starting at the enclosing tag.
+    """
+    result = {}
+    resume = 0
+    for anchor in CREDENTIAL_ANCHOR_PATTERN.finditer(content):
+        if anchor.start() < resume:
+            continue
+        start = max(resume, content.rfind('<', 0, anchor.start()))
+        match = CREDENTIAL_FIELD_PATTERN.search(content, start, anchor.end() + 1024)
+        if not match:
+            continue
+        resume = match.end()
+        group = match.lastgroup
+        key = group.split('_', 1)[0]
+        value = match.group(group).strip()
+        if value and key not in result:
+            result[key] = value
+            if len(result) == 2:
+                break
+    return result
+
+
+def is_word_char(content: str, index: int) -> bool:
+    return 0 <= index < len(content) and (content[index].isalnum() or content[index] == '_')
+
+
+def iter_credential_pairs(content: str, window: int = 512) -> Iterator[Tuple[int, str, str]]:
+    """Yield ``(score, api_id, api_hash)`` for bare id/hash candidates near each other.
+
+    One pass over the page: every id is paired with the nearest hash after it
+    and the nearest hash before it, if within ``window`` characters. The score
+    is the gap between them; hashes before the id are penalised by ``window``
+    so the usual id-then-hash layout wins. Lower is better.
+    """
+    pending = []
+    last_hash = None
+    for match in CREDENTIAL_CANDIDATE_PATTERN.finditer(content):
+        if match.start() and content[match.start() - 1] in '"\'':
+            # Quoted attribute/JSON values (csrf tokens, form hashes) are never the displayed credentials
+            continue
+        length = match.end() - match.start()
+        if length == 32:
+            for id_match in pending:
+                gap = match.start() - id_match.end()
+                if gap <= window:
+                    yield gap, id_match.group(), match.group()
+            pending = []
+            last_hash = match
+        elif (
+            length <= 9 and match.group().isdigit()
+            and not is_word_char(content, match.start() - 1)
+            and not is_word_char(content, match.end())
+        ):
+            if last_hash is not None:
+                gap = match.start() - last_hash.end()
+                if gap <= window:
+                    yield gap + window, match.group(), last_hash.group()
+            pending.append(match)
+
+
+def rank_credential_pairs(content: str, window: int = 512) -> List[Tuple[int, str, str]]:
+    """All pairs from iter_credential_pairs, best first"""
+    return sorted(iter_credential_pairs(content, window), key=lambda pair: pair[0])
+
+
+def extract_form_groups(content: str) -> Dict[str, str]:
+    """BeautifulSoup walk over the form-group label/span pairs"""
+    from bs4 import BeautifulSoup
+    result = {}
+    soup = BeautifulSoup(content, 'html.parser')
+    form_groups = soup.find_all('div', class_='form-group')
+    for group in form_groups:
+        label = group.find('label')
+        if label:
+            label_text = label.get_text().lower()
+            if 'api id' in label_text or 'app_id' in label_text:
+                span = group.find('span', class_='form-control')
+                if span:
+                    result['apiId'] = span.get_text(strip=True)
+            elif 'api hash' in label_text or 'app_hash' in label_text:
+                span = group.find('span', class_='form-control')
+                if span:
+                    result['apiHash'] = span.get_text(strip=True)
+    return result
+
+
+def extract_closest_pair(content: str) -> Dict[str, str]:
+    best = min(iter_credential_pairs(content), key=lambda pair: pair[0], default=None)
+    if best is None:
+        return {}
+    return {'apiId': best[1], 'apiHash': best[2]}
+
+
+def default_extractors(path: Optional[str] = None) -> ExtractorRegistry:
+    """The built-in strategies; the priors are rough costs that order each tier until counters exist.
+
+    The unlabelled scan only runs once both labelled readers have missed: on
+    a page with a csrf token or other hex runs it can pick the wrong value.
+    """
+    return ExtractorRegistry([
+        ExtractorStrategy('labelled_regex', scan_credential_fields, prior_ms=1.0),
+        ExtractorStrategy('form_group_soup', extract_form_groups, prior_ms=25.0),
+        ExtractorStrategy('closest_pair', extract_closest_pair, prior_ms=4.0, tier=1),
+    ], path)
+
+
+class CredentialStreamScanner:
+    """Runs scan_credential_fields over a body arriving in chunks.
+
+    Each chunk is scanned together with a short tail of the previous text, so
+    a field split across chunks is still found without rescanning the page.
+    """
+    overlap = 2048
+
+    def __init__(self, encoding: str = 'utf-8'):
+        self.decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+        self.parts = []
+        self.tail = ''
+        self.fields: Dict[str, str] = {}
+
+    def feed(self, chunk: bytes) -> bool:
+        """Add a chunk; True once both apiId and apiHash have been seen"""
+        text = self.decoder.decode(chunk)
+        if text:
+            self.parts.append(text)
+            window = self.tail + text
+            for key, value in scan_credential_fields(window).items():
+                self.fields.setdefault(key, value)
+            self.tail = window[-self.overlap:]
+        return self.complete()
+
+    def complete(self) -> bool:
+        return bool(self.fields.get('apiId') and self.fields.get('apiHash'))
+
+    def credentials(self) -> Optional[TelegramAppCredentials]:
+        if self.complete():
+            return TelegramAppCredentials(apiId=self.fields['apiId'], apiHash=self.fields['apiHash'])
+        return None
+
+    def text(self) -> str:
+        """Everything decoded so far (the whole page if the stream was not cut short)"""
+        return ''.join(self.parts) + self.decoder.decode(b'', final=True)
+
+
+def bytes_read(response: requests.Response) -> int:
+    """Body bytes a streamed response has pulled off the wire, if its adapter can tell"""
+    tell = getattr(response.raw, 'tell', None)
+    return tell() if tell is not None else 0
+
+
+class TelegramAppClientBase:
+    """Helpers shared by the blocking and asyncio clients"""
+    def __init__(
+        self,
+        session_store: Optional['SessionStore'] = None,
+        tracer: Optional[Tracer] = None,
+        transport: Optional[TransportConfig] = None,
+        extractors: Optional[ExtractorRegistry] = None
+    ):
+        self.base_url = 'https://my.telegram.org'
+        self.cookie_name = 'stel_token'
+        self.session_store = session_store
+        self.tracer = tracer or Tracer()
+        self.transport = transport or TransportConfig()
+        self.extractors = extractors or default_extractors()
+        # Pages no extractor could read are saved here when set
+        self.captures: Optional['CaptureStore'] = None
+        self.cancel_token = CancelToken()
+        self.csrf_ttl = 300.0
+        self.csrf_token: Optional[str] = None
+        self.csrf_fetched_at: Optional[float] = None
+        self.readiness = ReadinessPolicy()
+        self.retry_after: Optional[float] = None
+        # Read /apps incrementally and hang up once the credentials are seen
+        self.stream_pages = True
+        self.stream_chunk_size = 8192
+        self.headers = {
+            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+            'Accept-Language': 'en-US,en;q=0.5',
+            'Accept-Encoding': supported_encodings(),
+            'DNT': '1',
+            'Connection': 'keep-alive',
+            'Upgrade-Insecure-Requests': '1',
+        }
+
+    def log(self, text: str):
+        logger.info(text)
+
+    def use_cancel_token(self, token: CancelToken):
+        """Make every request, sleep and poll of this client honour ``token``"""
+        self.cancel_token = token
+
+    def save_extractor_stats(self):
+        """Persist the extractor counters; a failed write must not fail the run"""
+        try:
+            self.extractors.save()
+        except OSError as e:
+            self.log(f"Error saving extractor stats: {str(e)}")
+
+    def request_timeout(self) -> Tuple[float, float]:
+        """Transport timeout shrunk to the run's remaining time; raises once cancelled"""
+        return self.cancel_token.timeout(self.transport.timeout)
+
+    def normalize_phone_number(self, phone_number: str) -> str:
+        phone = phone_number.strip().replace('+', '').replace('(', '').replace(')', '').replace('-', '').replace(' ', '')
+        if not phone.isdigit():
+            raise ValueError('Invalid phone number')
+        return phone
+
+    def extract_csrf_token(self, html_content: str) -> Optional[str]:
+        try:
+            for pattern in CSRF_TOKEN_PATTERNS:
+                match = pattern.search(html_content)
+                if match:
+                    return match.group(1)
+            
+            return None
+            
+        except Exception as e:
+            self.log(f"Error extracting CSRF token: {e}")
+            return None
+
+    def parse_retry_after(self, value: Optional[str]) -> Optional[float]:
+        """Seconds from a Retry-After header given as delta-seconds or an HTTP date"""
+        if not value:
+            return None
+        value = value.strip()
+        if value.isdigit():
+            return float(value)
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+    def csrf_cache_valid(self) -> bool:
+        return self.csrf_fetched_at is not None and time.monotonic() - self.csrf_fetched_at < self.csrf_ttl
+
+    def remember_csrf_token(self, html_content: str) -> str:
+        """Cache the login page token (or its absence) for the next auth call"""
+        self.csrf_token = self.extract_csrf_token(html_content)
+        self.csrf_fetched_at = time.monotonic()
+        return self.csrf_token or "default_csrf_token"
+
+    def csrf_rejected(self, status: int, response_text: str) -> bool:
+        return status in (400, 403, 419) or 'csrf' in response_text[:512].lower()
+
+    def extract_random_hash(self, response_text: str) -> Optional[str]:
+        if 'random_hash' in response_text:
+            match = re.search(r'"random_hash":"([^"]+)"', response_text)
+            if match:
+                return match.group(1)
+        return None
+
+    def extract_stel_token(self, set_cookie: str) -> Optional[str]:
+        if 'stel_token=' in set_cookie:
+            match = re.search(r'stel_token=([^;]+)', set_cookie)
+            if match:
+                return match.group(1)
+        return None
+
+    def extract_hash_value(self, html_content: str) -> Optional[str]:
+        match = CREATE_HASH_PATTERN.search(html_content)
+        if match:
+            return match.group(1)
+        if 'hash' not in html_content:
+            return None
+        
+        from bs4 import BeautifulSoup
+        soup = BeautifulSoup(html_content, 'html.parser')
+        hash_input = soup.find('input', {'name': 'hash'})
+        
+        if not hash_input:
+            return None
+        
+        return hash_input.get('value', '')
+
+    def build_create_app_data(self, hash_value: str) -> Dict[str, str]:
+        random_text_selection = list('abcdefghijklmnopqrstuvwxyz0123456789')
+        random_title = ''.join(random.choices(random_text_selection, k=20))
+        random_shortname = ''.join(random.choices(random_text_selection, k=20))
+        
+        self.log(f"Generated random title: {random_title}")
+        self.log(f"Generated random shortname: {random_shortname}")
+        
+        return {
+            'hash': hash_value,
+            'app_title': random_title,
+            'app_shortname': random_shortname,
+            'app_url': 'https://example.com',
+            'app_platform': 'other',
+            'app_desc': 'Mobile application'
+        }
+
+    def find_credentials(self, content: str) -> Optional[TelegramAppCredentials]:
+        """Fast labelled-field lookup only, without the fallbacks of parse_credentials"""
+        fields = scan_credential_fields(content)
+        if fields.get('apiId') and fields.get('apiHash'):
+            return TelegramAppCredentials(apiId=fields['apiId'], apiHash=fields['apiHash'])
+        return None
+
+    def parse_create_response(self, status: int, content: str) -> TelegramAppCreateResult:
+        """Read the /apps/create reply (or the page it redirected to) for credentials or an error"""
+        if status != 200:
+            return TelegramAppCreateResult(
+                success=False, error=f"HTTP {status} from {TelegramAppRoutes.CREATE_APP}", rejected=400 <= status < 500
+            )
+        
+        credentials = self.find_credentials(content)
+        if credentials:
+            self.log("Credentials found in app creation response")
+            return TelegramAppCreateResult(success=True, credentials=credentials)
+        
+        body = content.strip()
+        if body and '<' not in body:
+            # createApp() shows plain-text replies to the user as errors
+            return TelegramAppCreateResult(success=False, error=body[:200], rejected=True)
+        
+        return TelegramAppCreateResult(success=True)
+
+    def extract_credentials_manual(self, html_content: str) -> Optional[TelegramAppCredentials]:
+        """Manual extraction as last resort: the closest id/hash pair on the page"""
+        try:
+            fields = extract_closest_pair(html_content)
+            if not fields:
+                return None
+            
+            return TelegramAppCredentials(apiId=fields['apiId'], apiHash=fields['apiHash'])
+        except Exception as e:
+            self.log(f"Error in manual extraction: {e}")
+            return None
+
+    def form_headers(self, referer: str, xhr: bool = False) -> Dict[str, str]:
+        headers = {
+            'Content-Type': 'application/x-www-form-urlencoded; charset=UTF-8',
+            'Referer': f'{self.base_url}{referer}',
+            'Origin': self.base_url
+        }
+        if xhr:
+            headers['X-Requested-With'] = 'XMLHttpRequest'
+        return headers
+
+    def parse_credentials(self, content: str) -> Optional[TelegramAppCredentials]:
+        """Extract credentials from an /apps page with multiple techniques"""
+        self.log(f"Page content length: {len(content)}")
+        
+        if not CREDENTIALS_SECTION_PATTERN.search(content):
+            self.log("API credentials section not found, might need to create app first")
+            return None
+        
+
+        result, strategy = self.extractors.run(content)
+        for key, value in result.items():
+            self.log(f"Found {key}: {value}")
+        
+        if strategy:
+            self.log(f"Credentials extracted by {strategy}")
+            return TelegramAppCredentials(
+                apiId=result['apiId'],
+                apiHash=result['apiHash']
+            )
+        
+        if self.captures is not None:
+            name = self.captures.capture(content, self.tracer.run_id, 'apps')
+            self.log(f"Page queued for inspection as {name} in {self.captures.directory}")
+        
+        return None
+
+
+class TelegramAppClient(TelegramAppClientBase):
+    def __init__(
+        self,
+        session_store: Optional['SessionStore'] = None,
+        tracer: Optional[Tracer] = None,
+        transport: Optional[TransportConfig] = None,
+        extractors: Optional[ExtractorRegistry] = None
+    ):
+        super().__init__(session_store, tracer, transport, extractors)
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.adapter = self.transport.mount(self.session)
+        self.session.hooks['response'].append(requests_response_hook)
+
+    def use_cancel_token(self, token: CancelToken):
+        super().use_cancel_token(token)
+        token.on_cancel(self.abort)
+        if isinstance(self.adapter, CancellableAdapter):
+            self.adapter.use_deadline(token.remaining)
+
+    def abort(self):
+        """Cut in-flight requests; safe to call from another thread"""
+        self.adapter.abort()
+
+    @traced('resume_session')
+    def resume_session(self, phone_number: str) -> Optional[str]:
+        """Return a saved stel_token if one cheap /apps request shows it is still valid"""
+        if self.session_store is None:
+            return None
+        try:
+            phone = self.normalize_phone_number(phone_number)
+            saved = self.session_store.load(phone)
+            if not saved:
+                return None
+            
+            for name, value in saved['cookies'].items():
+                self.session.cookies.set(name, value)
+            
+            if self.session_valid(saved['token']):
+                return saved['token']
+            
+            self.log("Saved session expired, signing in again")
+            self.session_store.delete(phone)
+            self.session.cookies.clear()
+            return None
+                
+        except Exception as e:
+            self.log(f"Error resuming saved session: {str(e)}")
+            return None
+
+    def session_valid(self, token: str) -> bool:
+        """One /apps request without following redirects: 200 means ``token`` is signed in"""
+        response = self.session.get(
+            f'{self.base_url}{TelegramAppRoutes.APPS}',
+            cookies={self.cookie_name: token},
+            timeout=self.request_timeout(),
+            allow_redirects=False
+        )
+        return response.status_code == 200
+
+    def import_browser_cookies(self, cookies: List[Dict], user_agent: Optional[str] = None) -> Optional[str]:
+        """Adopt a signed-in browser's cookies (WebDriver get_cookies() format); returns the stel_token"""
+        for cookie in cookies:
+            self.session.cookies.set(
+                cookie['name'],
+                cookie['value'],
+                domain=cookie.get('domain', ''),
+                path=cookie.get('path', '/')
+            )
+        if user_agent:
+            self.session.headers['User-Agent'] = user_agent
+        return next((cookie['value'] for cookie in cookies if cookie['name'] == self.cookie_name), None)
+
+    def save_session(self, phone_number: str, token: str):
+        if self.session_store is None:
+            return
+        try:
+            cookies = requests.utils.dict_from_cookiejar(self.session.cookies)
+            cookies[self.cookie_name] = token
+            self.session_store.save(self.normalize_phone_number(phone_number), token, cookies)
+        except Exception as e:
+            self.log(f"Error saving session: {str(e)}")
+
+    @traced('get_csrf_token')
+    def get_csrf_token(self, refresh: bool = False) -> str:
+        if not refresh and self.csrf_cache_valid():
+            return self.csrf_token or "default_csrf_token"
+        
+        response = self.session.get(f'{self.base_url}{TelegramAppRoutes.AUTH}', timeout=self.request_timeout())
+        return self.remember_csrf_token(response.text)
+
+    @traced('send_confirmation_code')
+    def send_confirmation_code(self, phone_number: str) -> Optional[str]:
+        try:
+            phone = self.normalize_phone_number(phone_number)
+            
+            for refresh in (False, True):
+                data = {'phone': phone, 'csrf_token': self.get_csrf_token(refresh)}
+                
+                response = self.session.post(
+                    f'{self.base_url}{TelegramAppRoutes.SEND_PASSWORD}',
+                    data=data,
+                    headers=self.form_headers(TelegramAppRoutes.AUTH, xhr=True),
+                    timeout=self.request_timeout()
+                )
+                
+                if response.status_code == 200:
+                    try:
+                        response_data = response.json()
+                        if 'random_hash' in response_data:
+                            return response_data['random_hash']
+                    except ValueError:
+                        random_hash = self.extract_random_hash(response.text)
+                        if random_hash:
+                            return random_hash
+                
+                if not self.csrf_rejected(response.status_code, response.text):
+                    break
+                self.log("CSRF token rejected, refreshing")
+                current_span().retries += 1
+            
+            return None
+                
+        except Exception as e:
+            self.log(f"Error sending confirmation code: {str(e)}")
+            return None
+
+    @traced('sign_in')
+    def sign_in(self, params: TelegramAppAuthParams) -> Optional[str]:
+        try:
+            phone = self.normalize_phone_number(params.phone)
+            
+            for refresh in (False, True):
+                data = {
+                    'phone': phone,
+                    'random_hash': params.random_hash,
+                    'password': params.code,
+                    'csrf_token': self.get_csrf_token(refresh)
+                }
+                
+                response = self.session.post(
+                    f'{self.base_url}{TelegramAppRoutes.AUTH}',
+                    data=data,
+                    headers=self.form_headers(TelegramAppRoutes.AUTH),
+                    timeout=self.request_timeout(),
+                    allow_redirects=True
+                )
+                
+                stel_token = None
+                if hasattr(response, 'cookies') and response.cookies:
+                    stel_token = response.cookies.get(self.cookie_name)
+                
+                if not stel_token:
+                    stel_token = self.extract_stel_token(response.headers.get('Set-Cookie', ''))
+                
+                if stel_token or not self.csrf_rejected(response.status_code, response.text):
+                    return stel_token
+                self.log("CSRF token rejected, refreshing")
+                current_span().retries += 1
+            
+            return None
+                
+        except Exception as e:
+            self.log(f"Error signing in: {str(e)}")
+            return None
+
+    @traced('create_app_js_method')
+    def create_app_js_method(self, token: str, app_params: TelegramApp) -> TelegramAppCreateResult:
+        """Alternative method using JavaScript-like approach"""
+        try:
+
+            response, content, existing = self.fetch_apps_page(token)
+            
+            if response.status_code != 200:
+                return TelegramAppCreateResult(success=False, error=f"HTTP {response.status_code} from {TelegramAppRoutes.APPS}")
+            
+            existing = existing or self.find_credentials(content)
+            if existing:
+                self.log("App already exists, skipping creation")
+                return TelegramAppCreateResult(success=True, credentials=existing)
+            
+            hash_value = self.extract_hash_value(content)
+            if hash_value is None:
+                return TelegramAppCreateResult(success=False, error="App creation form hash not found")
+            
+            data = self.build_create_app_data(hash_value)
+            
+            if self.readiness.create_delay:
+                self.cancel_token.sleep(self.readiness.create_delay)
+            
+
+            response = self.session.post(
+                f'{self.base_url}{TelegramAppRoutes.CREATE_APP}',
+                data=data,
+                cookies={self.cookie_name: token},
+                headers=self.form_headers(TelegramAppRoutes.APPS),
+                timeout=self.request_timeout()
+            )
+            
+            return self.parse_create_response(response.status_code, response.text)
+                
+        except Exception as e:
+            self.log(f"Error in JS method app creation: {str(e)}")
+            return TelegramAppCreateResult(success=False, error=str(e))
+
+    def fetch_apps_page(self, token: str) -> Tuple[requests.Response, str, Optional[TelegramAppCredentials]]:
+        """GET /apps, streaming the body and closing it once the credentials are seen.
+
+        Returns the (closed) response, the text read and the credentials found on
+        the way. The text is the whole page whenever no credentials were found.
+        """
+        with self.session.get(
+            f'{self.base_url}{TelegramAppRoutes.APPS}',
+            cookies={self.cookie_name: token},
+            timeout=self.request_timeout(),
+            stream=self.stream_pages
+        ) as response:
+            if not self.stream_pages:
+                return response, response.text, None
+            if response.status_code != 200:
+                return response, '', None
+            
+            # Skip requests' charset sniffing; the page declares utf-8
+            scanner = CredentialStreamScanner(response.encoding or 'utf-8')
+            for chunk in response.iter_content(self.stream_chunk_size):
+                if scanner.feed(chunk):
+                    self.log(f"Credentials found after {bytes_read(response)} bytes, closing stream")
+                    break
+            
+            span = current_span()
+            if span is not None:
+                span.record_bytes_in(bytes_read(response))
+            return response, scanner.text(), scanner.credentials()
+
+    @traced('get_credentials_advanced')
+    def get_credentials_advanced(self, token: str) -> Optional[TelegramAppCredentials]:
+        """Advanced method to extract credentials with multiple techniques"""
+        try:
+            response, content, credentials = self.fetch_apps_page(token)
+            
+            self.retry_after = self.parse_retry_after(response.headers.get('Retry-After'))
+            if response.status_code != 200:
+                return None
+            
+            return credentials or self.parse_credentials(content)
+                
+        except Exception as e:
+            self.log(f"Error getting credentials: {str(e)}")
+            return None
+
+    @traced('wait_for_credentials')
+    def wait_for_credentials(self, token: str, policy: Optional[ReadinessPolicy] = None) -> Optional[TelegramAppCredentials]:
+        """Poll /apps until the credentials appear or the readiness deadline passes"""
+        schedule = (policy or self.readiness).start()
+        self.retry_after = None
+        attempt = 0
+        while True:
+            delay = schedule.next_delay(self.retry_after)
+            if delay is None:
+                return None
+            if delay:
+                self.cancel_token.sleep(delay)
+            
+            attempt += 1
+            current_span().retries = attempt - 1
+            self.log(f"Attempt {attempt} to get credentials...")
+            credentials = self.get_credentials_advanced(token)
+            if credentials:
+                return credentials
@@ -0,0 +1,140 @@
+"""Credential extraction strategies ranked by how cheaply they have succeeded before"""
+import os
+import json
+import time
+import tempfile
+import threading
+from dataclasses import dataclass, asdict
+from typing import Callable, Dict, List, Optional, Tuple
+
+STATS_PATH_ENV = 'TG_API_GETTER_EXTRACTOR_STATS'
+# Weight of the newest observation; old markup stops dominating after a few polls
+EWMA_ALPHA = 0.2
+
+@dataclass
+class ExtractorStrategy:
+    """``extract`` maps page text to whichever of apiId/apiHash it can find.
+
+    ``tier`` groups strategies by how much their answers can be trusted:
+    labelled readers are tier 0 and heuristic scans tier 1. A cheap
+    heuristic that keeps "hitting" must not jump ahead of an exact reader.
+    """
+    name: str
+    extract: Callable[[str], Dict[str, str]]
+    prior_ms: float = 1.0
+    tier: int = 0
+
+@dataclass
+class ExtractorStats:
+    attempts: int = 0
+    successes: int = 0
+    hit_rate: float = 0.5
+    cost_ms: float = 0.0
+
+    def record(self, elapsed_ms: float, hit: bool):
+        self.attempts += 1
+        self.successes += int(hit)
+        self.hit_rate += EWMA_ALPHA * (float(hit) - self.hit_rate)
+        self.cost_ms += EWMA_ALPHA * (elapsed_ms - self.cost_ms)
+
+    def expected_cost(self) -> float:
+        """Milliseconds spent per successful extraction"""
+        return self.cost_ms / max(self.hit_rate, 0.01)
+
+
+def default_stats_path() -> str:
+    return os.environ.get(STATS_PATH_ENV) or os.path.join(
+        os.path.expanduser('~'), '.telegram_api_getter', 'extractor_stats.json'
+    )
+
+
+class ExtractorRegistry:
+    """Runs strategies tier by tier, cheapest-expected-first, and keeps their cost and hit counters.
+
+    Counters are moving averages, so when the page markup changes a pattern
+    that stops matching drops down the order within a few polls. With a
+    ``path`` the counters are loaded from and saved to a JSON file.
+    """
+    def __init__(self, strategies: Optional[List[ExtractorStrategy]] = None, path: Optional[str] = None):
+        self.strategies: List[ExtractorStrategy] = []
+        self.stats: Dict[str, ExtractorStats] = {}
+        self.path = path
+        self.lock = threading.Lock()
+        for strategy in strategies or []:
+            self.register(strategy)
+        if path:
+            self.load()
+
+    def register(self, strategy: ExtractorStrategy):
+        self.strategies.append(strategy)
+        self.stats.setdefault(strategy.name, ExtractorStats(cost_ms=strategy.prior_ms))
+
+    def ranked(self) -> List[ExtractorStrategy]:
+        with self.lock:
+            return sorted(self.strategies, key=lambda strategy: (strategy.tier, self.stats[strategy.name].expected_cost()))
+
+    def record(self, name: str, elapsed_ms: float, hit: bool):
+        with self.lock:
+            self.stats[name].record(elapsed_ms, hit)
+
+    def run(self, content: str) -> Tuple[Dict[str, str], Optional[str]]:
+        """Fields of the first ranked strategy to find both, and its name.
+
+        Values from different strategies are never combined. Without a winner
+        the first partial result is returned, for logging, with None.
+        """
+        partial: Dict[str, str] = {}
+        for strategy in self.ranked():
+            started = time.perf_counter()
+            try:
+                fields = strategy.extract(content)
+            except Exception:
+                fields = {}
+            hit = bool(fields.get('apiId') and fields.get('apiHash'))
+            self.record(strategy.name, (time.perf_counter() - started) * 1000, hit)
+
+            if hit:
+                return {'apiId': fields['apiId'], 'apiHash': fields['apiHash']}, strategy.name
+            if not partial:
+                partial = {key: value for key, value in fields.items() if value}
+        return partial, None
+
+    def load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return
+        with self.lock:
+            for name, values in saved.items():
+                if name in self.stats and isinstance(values, dict):
+                    self.stats[name] = ExtractorStats(**{
+                        key: values[key] for key in ('attempts', 'successes', 'hit_rate', 'cost_ms') if key in values
+                    })
+
+    def save(self):
+        if not self.path:
+            return
+        with self.lock:
+            payload = {name: asdict(stats) for name, stats in self.stats.items()}
+        directory = os.path.dirname(self.path) or '.'
+        os.makedirs(directory, exist_ok=True)
+        # A temp file of our own, so concurrent GUI/CLI processes cannot clobber each other's write
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=os.path.basename(self.path) + '.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(payload, f, indent=2)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def format_summary(self) -> str:
+        lines = []
+        for strategy in self.ranked():
+            stats = self.stats[strategy.name]
+            lines.append(
+                f"{strategy.name}: {stats.successes}/{stats.attempts} hits, "
+                f"{stats.cost_ms:.2f} ms avg, {stats.expected_cost():.2f} ms per hit"
+            )
+        return '\n'.join(lines)
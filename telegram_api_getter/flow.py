@@ -0,0 +1,131 @@
+"""The provisioning sequence shared by the GUI worker and the CLI"""
+from typing import Callable, Optional
+
+from .core import (
+    TelegramApp, TelegramAppAuthParams, TelegramAppClient,
+    TelegramAppCredentials
+)
+
+
+class ProvisioningFlow:
+    """Resume or sign in, create the app and fetch its credentials.
+
+    ``code_provider`` is called with the phone number once the confirmation
+    code has been sent and returns the code, or None to cancel. Cancelling
+    the client's cancel token raises Cancelled out of run().
+    """
+    def __init__(
+        self,
+        client: TelegramAppClient,
+        phone: str,
+        app_params: TelegramApp,
+        code_provider: Callable[[str], Optional[str]],
+        log: Optional[Callable[[str], None]] = None
+    ):
+        self.client = client
+        self.phone = phone
+        self.app_params = app_params
+        self.code_provider = code_provider
+        self.log = log or client.log
+        self.tracer = client.tracer
+
+    def checkpoint(self):
+        """Raise Cancelled if the run was cancelled; an aborted request only returns None"""
+        self.client.cancel_token.check()
+
+    def sign_in_with_code(self) -> str:
+        self.log("Sending confirmation code...")
+        random_hash = self.client.send_confirmation_code(self.phone)
+        self.checkpoint()
+        
+        if not random_hash:
+            raise Exception("Failed to send confirmation code")
+        
+        self.log(f"Confirmation code sent. Random hash: {random_hash}")
+        
+        with self.tracer.span('flow.code_entry'):
+            code = self.code_provider(self.phone)
+        self.checkpoint()
+        if code is None:
+            raise Exception("Verification code entry cancelled")
+        
+        self.log(f"Received verification code: {code}")
+        
+        self.log("Signing in with verification code...")
+        auth_params = TelegramAppAuthParams(
+            phone=self.phone,
+            random_hash=random_hash,
+            code=code
+        )
+        
+        token = self.client.sign_in(auth_params)
+        self.checkpoint()
+        
+        if not token:
+            raise Exception("Failed to sign in")
+        
+        self.log(f"Signed in successfully. Token: {token}")
+        return token
+
+    def final_check(self, token: str) -> Optional[TelegramAppCredentials]:
+        self.log("Final attempt: checking if app was created...")
+        response, content, credentials = self.client.fetch_apps_page(token)
+        
+        if response.status_code == 200:
+            if credentials:
+                return credentials
+
+            if 'application' in content.lower() or 'created' in content.lower():
+                self.log("App seems to be created but credentials not found")
+                return self.client.extract_credentials_manual(content)
+        
+        return None
+
+    def run(self) -> TelegramAppCredentials:
+        try:
+            with self.tracer.span('flow.run'):
+                return self.run_stages()
+        except Exception:
+            # A request cut short by cancellation fails with a plain error
+            self.checkpoint()
+            raise
+        finally:
+            self.client.save_extractor_stats()
+
+    def run_stages(self) -> TelegramAppCredentials:
+        with self.tracer.span('flow.login'):
+            token = self.client.resume_session(self.phone)
+            self.checkpoint()
+            if token:
+                self.log("Reusing saved session, skipping confirmation code")
+            else:
+                token = self.sign_in_with_code()
+                self.client.save_session(self.phone, token)
+        
+        self.log("Creating Telegram application with alternative method...")
+        with self.tracer.span('flow.create'):
+            create_result = self.client.create_app_js_method(token, self.app_params)
+        self.checkpoint()
+        
+        if create_result.rejected:
+            raise Exception(f"App creation failed: {create_result.error}")
+        if not create_result.success:
+            self.log(f"App creation may have failed ({create_result.error}), but continuing...")
+        
+        credentials = create_result.credentials
+        if not credentials:
+            self.log("Retrieving API credentials with advanced method...")
+            with self.tracer.span('flow.poll'):
+                credentials = self.client.wait_for_credentials(token)
+            self.checkpoint()
+        
+        if not credentials:
+            with self.tracer.span('flow.final_check'):
+                credentials = self.final_check(token)
+            self.checkpoint()
+        
+        if not credentials:
+            raise Exception("Failed to retrieve API credentials. The app may have been created but credentials are not accessible.")
+        
+        self.log("API credentials retrieved successfully")
+        return credentials
@@ -0,0 +1,120 @@
+"""Non-blocking, rotating, redacting log pipeline.
+
+Callers only mask secrets and put records on a queue; a QueueListener
+thread does the formatting and file/console I/O.
+"""
+import os
+import re
+import sys
+import json
+import queue
+import atexit
+import logging
+import logging.handlers
+from typing import Optional, List
+
+LOG_LEVEL_ENV = 'TG_API_GETTER_LOG_LEVEL'
+
+# (pattern, group holding the secret) for every secret the flow logs
+SECRET_PATTERNS = [
+    re.compile(r'(stel_token["\']?\s*[=:]\s*["\']?)([^"\'\s;,]+)', re.IGNORECASE),
+    re.compile(r'(random_hash["\']?\s*[=:]\s*["\']?)([^"\'\s;,&]+)', re.IGNORECASE),
+    re.compile(r'(csrf_token["\']?\s*[=:]\s*["\']?)([^"\'\s;,&]+)', re.IGNORECASE),
+    re.compile(r'(Random hash:\s*)(\S+)'),
+    re.compile(r'(Token:\s*)(\S+)'),
+    re.compile(r'(verification code:\s*)(\S+)', re.IGNORECASE),
+    re.compile(r'(api[_ ]?hash["\']?\s*[=:]\s*["\']?)([a-f0-9]{32})', re.IGNORECASE),
+]
+
+
+def mask(secret: str) -> str:
+    return secret[:4] + '…' if len(secret) > 8 else '…'
+
+
+def redact(text: str) -> str:
+    for pattern in SECRET_PATTERNS:
+        text = pattern.sub(lambda m: m.group(1) + mask(m.group(2)), text)
+    return text
+
+
+class RedactingFilter(logging.Filter):
+    """Masks tokens and hashes in the rendered message; attach it once, before the queue"""
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.msg = redact(record.getMessage())
+        record.args = None
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line, including any ``extra=`` fields"""
+    RESERVED = set(vars(logging.LogRecord('', 0, '', 0, '', None, None))) | {'message', 'asctime'}
+
+    def format(self, record: logging.LogRecord) -> str:
+        data = {
+            'ts': self.formatTime(record, '%Y-%m-%dT%H:%M:%S'),
+            'level': record.levelname,
+            'logger': record.name,
+            'thread': record.threadName,
+            'msg': record.getMessage(),
+        }
+        data.update({key: value for key, value in vars(record).items() if key not in self.RESERVED})
+        if record.exc_info:
+            data['exc'] = self.formatException(record.exc_info)
+        return json.dumps(data, default=str)
+
+
+class BackgroundListener(logging.handlers.QueueListener):
+    """QueueListener whose stop() may be called again, e.g. by atexit"""
+    def stop(self):
+        if self._thread is not None:
+            super().stop()
+
+
+def configure_logging(
+    path: Optional[str] = 'app_log.txt',
+    level: Optional[str] = None,
+    max_bytes: int = 5 * 1024 * 1024,
+    backup_count: int = 3,
+    when: Optional[str] = None,
+    console: bool = False,
+    json_lines: bool = False
+) -> BackgroundListener:
+    """Route the root logger through a queue to rotating file and/or console handlers.
+
+    ``when`` switches to time-based rotation (e.g. ``'midnight'``). The level
+    defaults to $TG_API_GETTER_LOG_LEVEL, then DEBUG.
+    """
+    level = (level or os.environ.get(LOG_LEVEL_ENV) or 'DEBUG').upper()
+    if json_lines:
+        formatter = JsonFormatter()
+    else:
+        formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
+    
+    handlers: List[logging.Handler] = []
+    if path:
+        if when:
+            file_handler = logging.handlers.TimedRotatingFileHandler(path, when=when, backupCount=backup_count, encoding='utf-8', delay=True)
+        else:
+            file_handler = logging.handlers.RotatingFileHandler(path, maxBytes=max_bytes, backupCount=backup_count, encoding='utf-8', delay=True)
+        handlers.append(file_handler)
+    if console:
+        handlers.append(logging.StreamHandler(sys.stderr))
+    
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        if isinstance(handler, logging.handlers.QueueHandler):
+            root.removeHandler(handler)
+    # Masking rewrites the shared record, so it must run once and not per handler
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.addFilter(RedactingFilter())
+    root.addHandler(queue_handler)
+    root.setLevel(level)
+    
+    listener = BackgroundListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
@@ -0,0 +1,59 @@
+"""Encrypted on-disk cache of signed-in my.telegram.org sessions"""
+import os
+import json
+import time
+import hashlib
+from typing import Optional, Dict
+
+from cryptography.fernet import Fernet, InvalidToken
+
+class SessionStore:
+    """Encrypted on-disk stel_token cache keyed by normalized phone number.
+
+    The Fernet key comes from TG_API_GETTER_SESSION_KEY or a 0600 key file
+    created next to the session directory on first use.
+    """
+    def __init__(self, directory: Optional[str] = None, key: Optional[bytes] = None):
+        self.directory = directory or os.path.join(os.path.expanduser('~'), '.telegram_api_getter', 'sessions')
+        os.makedirs(self.directory, mode=0o700, exist_ok=True)
+        self.fernet = Fernet(key or os.environ.get('TG_API_GETTER_SESSION_KEY') or self.load_or_create_key())
+
+    def load_or_create_key(self) -> bytes:
+        key_path = os.path.join(os.path.dirname(self.directory), 'session.key')
+        if os.path.exists(key_path):
+            with open(key_path, 'rb') as f:
+                return f.read().strip()
+        
+        key = Fernet.generate_key()
+        fd = os.open(key_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(key)
+        return key
+
+    def path_for(self, phone: str) -> str:
+        return os.path.join(self.directory, hashlib.sha256(phone.encode()).hexdigest() + '.session')
+
+    def load(self, phone: str) -> Optional[Dict]:
+        try:
+            with open(self.path_for(phone), 'rb') as f:
+                return json.loads(self.fernet.decrypt(f.read()))
+        except FileNotFoundError:
+            return None
+        except (InvalidToken, ValueError):
+            self.delete(phone)
+            return None
+
+    def save(self, phone: str, token: str, cookies: Dict[str, str]):
+        payload = json.dumps({'token': token, 'cookies': cookies, 'saved_at': time.time()})
+        path = self.path_for(phone)
+        tmp_path = f'{path}.tmp'
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(self.fernet.encrypt(payload.encode()))
+        os.replace(tmp_path, path)
+
+    def delete(self, phone: str):
+        try:
+            os.remove(self.path_for(phone))
+        except FileNotFoundError:
+            pass
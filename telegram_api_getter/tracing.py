@@ -0,0 +1,243 @@
+"""Per-phase timing spans with JSON-lines export.
+
+Spans nest through a context variable, so they work the same in worker
+threads and asyncio tasks. HTTP hooks attribute status and byte counts to
+whichever span is open when a response arrives. Span lines go to the sink
+through a queue and a rotating file written by a background thread.
+"""
+import os
+import json
+import time
+import uuid
+import inspect
+import logging
+import functools
+import threading
+import contextvars
+from contextlib import contextmanager
+from dataclasses import dataclass, field, fields
+from typing import Optional, Dict, List, Any, IO
+
+TRACE_PATH_ENV = 'TG_API_GETTER_TRACE'
+TRACE_MAX_BYTES = 5 * 1024 * 1024
+TRACE_BACKUP_COUNT = 3
+
+_current_span: contextvars.ContextVar[Optional['Span']] = contextvars.ContextVar('telegram_api_getter_span', default=None)
+_sink_loggers: Dict[str, logging.Logger] = {}
+_sink_lock = threading.Lock()
+
+
+def sink_logger(path: str) -> logging.Logger:
+    """Logger whose records become lines of ``path``, written and rotated off the calling thread.
+
+    One queue and listener per file, shared by every Tracer writing to it.
+    """
+    path = os.path.abspath(path)
+    with _sink_lock:
+        logger = _sink_loggers.get(path)
+        if logger is not None:
+            return logger
+        
+        import queue
+        import atexit
+        import logging.handlers
+        from .logs import BackgroundListener
+        
+        handler = logging.handlers.RotatingFileHandler(
+            path, maxBytes=TRACE_MAX_BYTES, backupCount=TRACE_BACKUP_COUNT, encoding='utf-8', delay=True
+        )
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        span_queue: queue.SimpleQueue = queue.SimpleQueue()
+        listener = BackgroundListener(span_queue, handler)
+        listener.start()
+        atexit.register(listener.stop)
+        
+        logger = logging.getLogger(f'telegram_api_getter.trace.{len(_sink_loggers)}')
+        logger.propagate = False
+        logger.setLevel(logging.INFO)
+        logger.addHandler(logging.handlers.QueueHandler(span_queue))
+        _sink_loggers[path] = logger
+        return logger
+
+
+@dataclass
+class Span:
+    name: str
+    run_id: str
+    parent: Optional[str] = None
+    started_at: float = 0.0
+    duration_ms: float = 0.0
+    status: Optional[int] = None
+    requests: int = 0
+    bytes_in: int = 0
+    bytes_out: int = 0
+    retries: int = 0
+    error: Optional[str] = None
+    attrs: Dict[str, Any] = field(default_factory=dict)
+    parent_span: Optional['Span'] = field(default=None, repr=False, compare=False)
+
+    def record_http(self, status: int, bytes_in: int, bytes_out: int):
+        self.status = status
+        self.requests += 1
+        self.bytes_in += bytes_in
+        self.bytes_out += bytes_out
+        # Outer spans see the traffic of their children too
+        if self.parent_span is not None:
+            self.parent_span.record_http(status, bytes_in, bytes_out)
+
+    def record_bytes_in(self, bytes_in: int):
+        """Body bytes read after the response hook ran (streamed responses)"""
+        self.bytes_in += bytes_in
+        if self.parent_span is not None:
+            self.parent_span.record_bytes_in(bytes_in)
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {f.name: getattr(self, f.name) for f in fields(self) if f.name != 'parent_span'}
+        data['duration_ms'] = round(self.duration_ms, 3)
+        return data
+
+
+class Tracer:
+    """Collects spans for one provisioning run and optionally appends them to a JSON-lines file"""
+    def __init__(self, sink: Optional[str] = None, run_id: Optional[str] = None):
+        self.sink = sink
+        self.run_id = run_id or uuid.uuid4().hex[:12]
+        self.spans: List[Span] = []
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls, default: Optional[str] = None) -> 'Tracer':
+        """Tracer whose sink is $TG_API_GETTER_TRACE, falling back to ``default``"""
+        return cls(sink=os.environ.get(TRACE_PATH_ENV, default))
+
+    @contextmanager
+    def span(self, name: str, **attrs):
+        parent = _current_span.get()
+        span = Span(
+            name=name,
+            run_id=self.run_id,
+            parent=parent.name if parent else None,
+            started_at=time.time(),
+            attrs=attrs,
+            parent_span=parent
+        )
+        token = _current_span.set(span)
+        start = time.perf_counter()
+        try:
+            yield span
+        except BaseException as e:
+            span.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            span.duration_ms = (time.perf_counter() - start) * 1000
+            _current_span.reset(token)
+            self.finish(span)
+
+    def finish(self, span: Span):
+        with self._lock:
+            self.spans.append(span)
+        if self.sink:
+            self.write(span)
+
+    def write(self, span: Span, stream: Optional[IO[str]] = None):
+        line = json.dumps(span.to_dict(), default=str)
+        if stream is not None:
+            stream.write(line + '\n')
+            return
+        sink_logger(self.sink).info(line)
+
+    def export_jsonl(self, path: str):
+        with self._lock, open(path, 'a', encoding='utf-8') as f:
+            for span in self.spans:
+                self.write(span, f)
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """Total time, requests and bytes per span name, in first-seen order"""
+        totals: Dict[str, Dict[str, Any]] = {}
+        with self._lock:
+            for span in self.spans:
+                entry = totals.setdefault(span.name, {'name': span.name, 'count': 0, 'duration_ms': 0.0, 'requests': 0, 'bytes_in': 0, 'retries': 0})
+                entry['count'] += 1
+                entry['duration_ms'] += span.duration_ms
+                entry['requests'] += span.requests
+                entry['bytes_in'] += span.bytes_in
+                entry['retries'] += span.retries
+        return list(totals.values())
+
+    def format_summary(self, prefix: str = '') -> str:
+        lines = []
+        for entry in self.summary():
+            if prefix and not entry['name'].startswith(prefix):
+                continue
+            line = f"{entry['name']}: {entry['duration_ms']:.0f} ms"
+            if entry['requests']:
+                line += f", {entry['requests']} req, {entry['bytes_in'] / 1024:.1f} KB"
+            if entry['retries']:
+                line += f", {entry['retries']} retries"
+            lines.append(line)
+        return '\n'.join(lines)
+
+
+def current_span() -> Optional[Span]:
+    return _current_span.get()
+
+
+def traced(name: str):
+    """Wrap a client method (sync or async) in a span on ``self.tracer``"""
+    def decorator(method):
+        if inspect.iscoroutinefunction(method):
+            @functools.wraps(method)
+            async def async_wrapper(self, *args, **kwargs):
+                with self.tracer.span(name):
+                    return await method(self, *args, **kwargs)
+            return async_wrapper
+        
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            with self.tracer.span(name):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def requests_response_hook(response, *args, **kwargs):
+    """requests ``response`` hook feeding status and byte counts into the open span"""
+    span = _current_span.get()
+    if span is None:
+        return response
+    
+    length = response.headers.get('Content-Length')
+    if kwargs.get('stream'):
+        # The reader may stop early; it reports what it actually read
+        bytes_in = 0
+    elif length is not None and length.isdigit():
+        bytes_in = int(length)
+    else:
+        bytes_in = len(response.content)
+    
+    body = response.request.body if response.request is not None else None
+    bytes_out = len(body) if body else 0
+    span.record_http(response.status_code, bytes_in, bytes_out)
+    
+    # Transport-level retries done by urllib3 before this response arrived
+    retries = getattr(response.raw, 'retries', None)
+    if retries is not None and retries.history:
+        span.retries += len(retries.history)
+    return response
+
+
+def aiohttp_trace_config():
+    """aiohttp TraceConfig doing for the async client what requests_response_hook does"""
+    import aiohttp
+
+    async def on_request_end(session, context, params):
+        span = _current_span.get()
+        if span is None:
+            return
+        length = params.response.headers.get('Content-Length')
+        bytes_in = int(length) if length is not None and length.isdigit() else 0
+        span.record_http(params.response.status, bytes_in, 0)
+
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_request_end.append(on_request_end)
+    return trace_config
@@ -0,0 +1,307 @@
+"""HTTP transport settings shared by the blocking and asyncio clients.
+
+Batch jobs and the GUI can pass their own TransportConfig to tune pool
+size, timeouts, retries and HTTP/2 independently.
+"""
+import os
+import ssl
+import socket
+import weakref
+import threading
+import http.client
+from types import SimpleNamespace
+from dataclasses import dataclass
+from typing import Callable, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter, BaseAdapter
+from requests.cookies import extract_cookies_to_jar
+from requests.structures import CaseInsensitiveDict
+from requests.utils import DEFAULT_CA_BUNDLE_PATH, get_encoding_from_headers, select_proxy
+from urllib3.util.retry import Retry
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+IDEMPOTENT_METHODS = frozenset(['GET', 'HEAD', 'OPTIONS'])
+
+
+def supported_encodings() -> str:
+    """Accept-Encoding value listing only encodings we can actually decode"""
+    encodings = ['gzip', 'deflate']
+    for module in ('brotli', 'brotlicffi'):
+        try:
+            __import__(module)
+        except ImportError:
+            continue
+        encodings.append('br')
+        break
+    return ', '.join(encodings)
+
+
+class AbortableRetry(Retry):
+    """Retry that gives up at once, without backoff, after its adapter aborted.
+
+    ``remaining`` returns the seconds left before the run's deadline (or
+    None); no retry is started that could not begin before it.
+    """
+    def __init__(
+        self,
+        *args,
+        abort_event: Optional[threading.Event] = None,
+        remaining: Optional[Callable[[], Optional[float]]] = None,
+        **kwargs
+    ):
+        self.abort_event = abort_event or threading.Event()
+        self.remaining = remaining
+        super().__init__(*args, **kwargs)
+
+    def new(self, **kwargs) -> 'AbortableRetry':
+        kwargs.setdefault('abort_event', self.abort_event)
+        kwargs.setdefault('remaining', self.remaining)
+        return super().new(**kwargs)
+
+    def time_left(self) -> Optional[float]:
+        return self.remaining() if self.remaining is not None else None
+
+    def is_exhausted(self) -> bool:
+        if self.abort_event.is_set():
+            return True
+        time_left = self.time_left()
+        if time_left is not None and time_left <= self.get_backoff_time():
+            return True
+        return super().is_exhausted()
+
+    def sleep(self, response=None):
+        if self.abort_event.is_set():
+            return
+        time_left = self.time_left()
+        if time_left is None:
+            super().sleep(response)
+            return
+        
+        delay = None
+        if response is not None and self.respect_retry_after_header:
+            delay = self.get_retry_after(response)
+        if delay is None:
+            delay = self.get_backoff_time()
+        # Never sleep past the deadline, and wake up on abort
+        self.abort_event.wait(max(0.0, min(delay, time_left)))
+
+
+@dataclass
+class TransportConfig:
+    pool_connections: int = 4
+    pool_maxsize: int = 10
+    connect_timeout: float = 5.0
+    read_timeout: float = 30.0
+    retries: int = 2
+    backoff_factor: float = 0.3
+    retry_statuses: Tuple[int, ...] = (429, 500, 502, 503, 504)
+    http2: bool = False
+
+    @property
+    def timeout(self) -> Tuple[float, float]:
+        return (self.connect_timeout, self.read_timeout)
+
+    def retry_policy(self, abort_event: Optional[threading.Event] = None) -> AbortableRetry:
+        # Only idempotent requests are retried; a repeated send_password or
+        # apps/create POST could send a second code or create a second app.
+        return AbortableRetry(
+            total=self.retries,
+            connect=self.retries,
+            read=self.retries,
+            status=self.retries,
+            allowed_methods=IDEMPOTENT_METHODS,
+            status_forcelist=self.retry_statuses,
+            backoff_factor=self.backoff_factor,
+            respect_retry_after_header=True,
+            raise_on_status=False,
+            abort_event=abort_event
+        )
+
+    def mount(self, session: requests.Session) -> BaseAdapter:
+        """Install the adapter on ``session``; its abort() drops in-flight requests"""
+        if self.http2:
+            adapter = Http2Adapter(self)
+        else:
+            abort_event = threading.Event()
+            adapter = CancellableAdapter(
+                abort_event,
+                pool_connections=self.pool_connections,
+                pool_maxsize=self.pool_maxsize,
+                max_retries=self.retry_policy(abort_event)
+            )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return adapter
+
+
+def tracking_pool(pool_cls, adapter: 'CancellableAdapter'):
+    """Subclass of a urllib3 pool whose connections register with ``adapter``"""
+    class Connection(pool_cls.ConnectionCls):
+        def connect(self):
+            # Also stops urllib3's retries from reconnecting after an abort
+            if adapter.abort_event.is_set():
+                raise ConnectionAbortedError("Request aborted")
+            super().connect()
+            adapter.connections.add(self)
+    
+    return type(pool_cls.__name__, (pool_cls,), {'ConnectionCls': Connection})
+
+
+class CancellableAdapter(HTTPAdapter):
+    """HTTPAdapter that can cut every open connection from another thread"""
+    def __init__(self, abort_event: Optional[threading.Event] = None, *args, **kwargs):
+        self.connections: weakref.WeakSet = weakref.WeakSet()
+        self.abort_event = abort_event or threading.Event()
+        super().__init__(*args, **kwargs)
+
+    def use_deadline(self, remaining: Callable[[], Optional[float]]):
+        """Stop urllib3's retries once ``remaining()`` runs out"""
+        self.max_retries = self.max_retries.new(remaining=remaining)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': tracking_pool(HTTPConnectionPool, self),
+            'https': tracking_pool(HTTPSConnectionPool, self),
+        }
+
+    def abort(self):
+        self.abort_event.set()
+        # Shutting the raw socket down wakes a thread blocked in recv();
+        # the TLS layer is bypassed so no other thread's state is touched
+        for connection in list(self.connections):
+            sock = getattr(connection, 'sock', None)
+            if sock is None:
+                continue
+            try:
+                socket.socket.shutdown(sock, socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+
+class _HttpxRaw:
+    """Just enough of urllib3's response for requests: cookie headers and body streaming"""
+    def __init__(self, response):
+        self.response = response
+        message = http.client.HTTPMessage()
+        for key, value in response.headers.multi_items():
+            message[key] = value
+        self._original_response = SimpleNamespace(msg=message)
+
+    def stream(self, amt=None, decode_content=True):
+        yield from self.response.iter_bytes(amt)
+
+    def tell(self) -> int:
+        """Body bytes received so far, before decoding, like urllib3's tell()"""
+        return self.response.num_bytes_downloaded
+
+    def close(self):
+        self.response.close()
+
+
+class Http2Adapter(BaseAdapter):
+    """requests adapter backed by httpx HTTP/2 clients (``pip install httpx[http2]``).
+
+    requests resolves ``verify``, ``cert`` and ``proxies`` per request; one
+    httpx client is kept for each combination seen.
+    """
+    def __init__(self, config: TransportConfig):
+        super().__init__()
+        try:
+            import httpx
+        except ImportError as e:
+            raise ImportError("HTTP/2 transport needs httpx: pip install 'httpx[http2]'") from e
+        
+        self.config = config
+        self.limits = httpx.Limits(max_connections=config.pool_maxsize, max_keepalive_connections=config.pool_maxsize)
+        self.clients = {}
+        self.lock = threading.Lock()
+        self.aborted = False
+
+    @staticmethod
+    def tls_settings(verify, cert):
+        """httpx ``verify`` value equivalent to requests' ``verify`` and ``cert``"""
+        if verify is True and not cert:
+            return True
+        if verify is False:
+            context = ssl.create_default_context()
+            context.check_hostname = False
+            context.verify_mode = ssl.CERT_NONE
+        elif isinstance(verify, str) and os.path.isdir(verify):
+            context = ssl.create_default_context(capath=verify)
+        else:
+            context = ssl.create_default_context(cafile=verify if isinstance(verify, str) else DEFAULT_CA_BUNDLE_PATH)
+        if cert:
+            certfile, keyfile = cert if isinstance(cert, tuple) else (cert, None)
+            context.load_cert_chain(certfile, keyfile)
+        return context
+
+    def client_for(self, verify, cert, proxy):
+        import httpx
+        
+        key = (verify, cert, proxy)
+        with self.lock:
+            if self.aborted:
+                raise ConnectionAbortedError("Request aborted")
+            client = self.clients.get(key)
+            if client is None:
+                # requests already applied the environment's proxies and CA bundle
+                transport = httpx.HTTPTransport(
+                    verify=self.tls_settings(verify, cert),
+                    http2=True,
+                    limits=self.limits,
+                    proxy=proxy,
+                    retries=self.config.retries,
+                    trust_env=False
+                )
+                client = httpx.Client(transport=transport, follow_redirects=False, trust_env=False)
+                self.clients[key] = client
+            return client
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        import httpx
+        
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+        else:
+            connect = read = timeout
+        
+        client = self.client_for(verify, cert, select_proxy(request.url, proxies or {}))
+        response = client.send(
+            client.build_request(
+                request.method,
+                request.url,
+                headers=dict(request.headers),
+                content=request.body,
+                timeout=httpx.Timeout(read, connect=connect)
+            ),
+            stream=stream
+        )
+        
+        result = requests.Response()
+        result.status_code = response.status_code
+        result.headers = CaseInsensitiveDict(response.headers.multi_items())
+        result.encoding = get_encoding_from_headers(result.headers)
+        result.reason = response.reason_phrase
+        result.url = request.url
+        result.request = request
+        result.connection = self
+        result.raw = _HttpxRaw(response)
+        if not stream:
+            result._content = response.content
+            result._content_consumed = True
+        extract_cookies_to_jar(result.cookies, request, result.raw)
+        return result
+
+    def close(self):
+        with self.lock:
+            clients = list(self.clients.values())
+            self.clients.clear()
+        for client in clients:
+            client.close()
+
+    def abort(self):
+        with self.lock:
+            self.aborted = True
+        self.close()